@@ -1,5 +1,7 @@
 """Buildify 3D Gaussian Splatting - Python API"""
 
+import functools
+
 try:
     from .pybuildify import *
     from .pybuildify import __version__
@@ -8,7 +10,31 @@ try:
     from . import pybuildify
     core = pybuildify.core
     utils = pybuildify.utils
-    
+
+    # Optional raw-CPython fast path; the pybind11 Vector3 stays the
+    # type the engine APIs accept.
+    try:
+        from ._vec3fast import Vector3 as FastVector3
+        utils.FastVector3 = FastVector3
+    except ImportError:
+        pass
+
+    @functools.cache
+    def _cached_axis_angle(x, y, z, angle):
+        return utils.Quaternion.from_axis_angle(utils.Vector3(x, y, z), angle)
+
+    def quat_from_axis_angle(x, y, z, angle):
+        """Memoized Quaternion.from_axis_angle keyed by scalar components.
+
+        Constant rotations (axis-aligned 45/90-degree turns and the like)
+        recur in scene setup; caching them skips the trig and the Vector3
+        round-trip after the first call.
+        """
+        return _cached_axis_angle(float(x), float(y), float(z), float(angle))
+
+    utils.quat_from_axis_angle = quat_from_axis_angle
+
+
 except ImportError as e:
     import warnings
     warnings.warn(f"Failed to import C++ extensions: {e}")
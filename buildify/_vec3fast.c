@@ -0,0 +1,203 @@
+/* Hand-rolled CPython Vector3 for latency-critical call sites.
+ *
+ * The pybind11 Vector3 binding pays framework dispatch cost on every
+ * constructor and arithmetic call. This module implements the same hot
+ * operations (construction, +, -, scalar *, dot, cross, length,
+ * normalized) directly against the C API: one object allocation and
+ * three float stores per result, no argument vector or type-info lookup.
+ *
+ * It is exposed as buildify.utils.FastVector3 alongside the pybind11
+ * Vector3, which remains the type understood by the engine APIs.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <structmember.h>
+#include <math.h>
+
+typedef struct {
+    PyObject_HEAD
+    float x, y, z;
+} Vec3Object;
+
+static PyTypeObject Vec3_Type;
+
+static PyObject*
+vec3_create(float x, float y, float z)
+{
+    Vec3Object* v = PyObject_New(Vec3Object, &Vec3_Type);
+    if (v == NULL) {
+        return NULL;
+    }
+    v->x = x;
+    v->y = y;
+    v->z = z;
+    return (PyObject*)v;
+}
+
+static PyObject*
+vec3_new(PyTypeObject* type, PyObject* args, PyObject* kwds)
+{
+    float x = 0.0f, y = 0.0f, z = 0.0f;
+    static char* kwlist[] = {"x", "y", "z", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|fff", kwlist, &x, &y, &z)) {
+        return NULL;
+    }
+    return vec3_create(x, y, z);
+}
+
+static PyObject*
+vec3_add(PyObject* a, PyObject* b)
+{
+    if (!PyObject_TypeCheck(a, &Vec3_Type) || !PyObject_TypeCheck(b, &Vec3_Type)) {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+    Vec3Object* va = (Vec3Object*)a;
+    Vec3Object* vb = (Vec3Object*)b;
+    return vec3_create(va->x + vb->x, va->y + vb->y, va->z + vb->z);
+}
+
+static PyObject*
+vec3_subtract(PyObject* a, PyObject* b)
+{
+    if (!PyObject_TypeCheck(a, &Vec3_Type) || !PyObject_TypeCheck(b, &Vec3_Type)) {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+    Vec3Object* va = (Vec3Object*)a;
+    Vec3Object* vb = (Vec3Object*)b;
+    return vec3_create(va->x - vb->x, va->y - vb->y, va->z - vb->z);
+}
+
+static PyObject*
+vec3_multiply(PyObject* a, PyObject* b)
+{
+    /* Vector * scalar only; keep operand handling minimal. */
+    if (PyObject_TypeCheck(a, &Vec3_Type)) {
+        double s = PyFloat_AsDouble(b);
+        if (s == -1.0 && PyErr_Occurred()) {
+            PyErr_Clear();
+            Py_RETURN_NOTIMPLEMENTED;
+        }
+        Vec3Object* v = (Vec3Object*)a;
+        return vec3_create((float)(v->x * s), (float)(v->y * s), (float)(v->z * s));
+    }
+    Py_RETURN_NOTIMPLEMENTED;
+}
+
+static PyObject*
+vec3_dot(PyObject* self, PyObject* other)
+{
+    if (!PyObject_TypeCheck(other, &Vec3_Type)) {
+        PyErr_SetString(PyExc_TypeError, "dot expects a FastVector3");
+        return NULL;
+    }
+    Vec3Object* a = (Vec3Object*)self;
+    Vec3Object* b = (Vec3Object*)other;
+    return PyFloat_FromDouble(a->x * b->x + a->y * b->y + a->z * b->z);
+}
+
+static PyObject*
+vec3_cross(PyObject* self, PyObject* other)
+{
+    if (!PyObject_TypeCheck(other, &Vec3_Type)) {
+        PyErr_SetString(PyExc_TypeError, "cross expects a FastVector3");
+        return NULL;
+    }
+    Vec3Object* a = (Vec3Object*)self;
+    Vec3Object* b = (Vec3Object*)other;
+    return vec3_create(a->y * b->z - a->z * b->y,
+                       a->z * b->x - a->x * b->z,
+                       a->x * b->y - a->y * b->x);
+}
+
+static PyObject*
+vec3_length(PyObject* self, PyObject* Py_UNUSED(ignored))
+{
+    Vec3Object* v = (Vec3Object*)self;
+    return PyFloat_FromDouble(sqrt((double)(v->x * v->x + v->y * v->y + v->z * v->z)));
+}
+
+static PyObject*
+vec3_normalized(PyObject* self, PyObject* Py_UNUSED(ignored))
+{
+    Vec3Object* v = (Vec3Object*)self;
+    float len = sqrtf(v->x * v->x + v->y * v->y + v->z * v->z);
+    if (len > 0.0f) {
+        float inv = 1.0f / len;
+        return vec3_create(v->x * inv, v->y * inv, v->z * inv);
+    }
+    return vec3_create(0.0f, 0.0f, 0.0f);
+}
+
+static PyObject*
+vec3_repr(PyObject* self)
+{
+    Vec3Object* v = (Vec3Object*)self;
+    char buf[96];
+    PyOS_snprintf(buf, sizeof(buf), "FastVector3(%g, %g, %g)",
+                  (double)v->x, (double)v->y, (double)v->z);
+    return PyUnicode_FromString(buf);
+}
+
+static PyMemberDef vec3_members[] = {
+    {"x", T_FLOAT, offsetof(Vec3Object, x), 0, "x component"},
+    {"y", T_FLOAT, offsetof(Vec3Object, y), 0, "y component"},
+    {"z", T_FLOAT, offsetof(Vec3Object, z), 0, "z component"},
+    {NULL}
+};
+
+static PyMethodDef vec3_methods[] = {
+    {"dot", vec3_dot, METH_O, "Dot product with another FastVector3"},
+    {"cross", vec3_cross, METH_O, "Cross product with another FastVector3"},
+    {"length", vec3_length, METH_NOARGS, "Euclidean length"},
+    {"normalized", vec3_normalized, METH_NOARGS, "Unit-length copy"},
+    {NULL}
+};
+
+static PyNumberMethods vec3_as_number = {
+    .nb_add = vec3_add,
+    .nb_subtract = vec3_subtract,
+    .nb_multiply = vec3_multiply,
+};
+
+static PyTypeObject Vec3_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "buildify._vec3fast.Vector3",
+    .tp_basicsize = sizeof(Vec3Object),
+    .tp_dealloc = (destructor)PyObject_Del,
+    .tp_repr = vec3_repr,
+    .tp_as_number = &vec3_as_number,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc = "3-component float vector with raw CPython fast paths",
+    .tp_methods = vec3_methods,
+    .tp_members = vec3_members,
+    .tp_new = vec3_new,
+};
+
+static struct PyModuleDef vec3fast_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "_vec3fast",
+    .m_doc = "Raw CPython fast path for hot Vector3 operations",
+    .m_size = -1,
+};
+
+PyMODINIT_FUNC
+PyInit__vec3fast(void)
+{
+    if (PyType_Ready(&Vec3_Type) < 0) {
+        return NULL;
+    }
+
+    PyObject* module = PyModule_Create(&vec3fast_module);
+    if (module == NULL) {
+        return NULL;
+    }
+
+    Py_INCREF(&Vec3_Type);
+    if (PyModule_AddObject(module, "Vector3", (PyObject*)&Vec3_Type) < 0) {
+        Py_DECREF(&Vec3_Type);
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
@@ -4,6 +4,11 @@
 #include <pybind11/numpy.h>
 
 #include "buildify/buildify.hpp"
+#include "buildify/utils/batch_math.hpp"
+
+#include <cstdint>
+#include <cstring>
+#include <vector>
 
 #ifdef WITH_PYTORCH
 #include <torch/extension.h>
@@ -12,6 +17,29 @@
 namespace py = pybind11;
 using namespace buildify;
 
+namespace {
+
+// Unpack a flat (10,) float buffer - 3 position + 4 rotation (xyzw) +
+// 3 scale - into a Transform in one binding crossing instead of three
+// attribute assignments that each copy a Vector3/Quaternion by value.
+utils::Transform transform_from_prs(
+    py::array_t<float, py::array::c_style | py::array::forcecast> prs) {
+    auto buf = prs.request();
+    if (buf.ndim != 1 || buf.shape[0] != 10) {
+        throw std::invalid_argument(
+            "set_prs expects a flat float array of 10 values: "
+            "3 position + 4 rotation (xyzw) + 3 scale");
+    }
+    const auto* p = static_cast<const float*>(buf.ptr);
+    utils::Transform transform;
+    transform.position = {p[0], p[1], p[2]};
+    transform.rotation = {p[3], p[4], p[5], p[6]};
+    transform.scale = {p[7], p[8], p[9]};
+    return transform;
+}
+
+}
+
 PYBIND11_MODULE(pybuildify, m) {
     m.doc() = "Buildify 3D Gaussian Splatting Python bindings";
 
@@ -25,13 +53,28 @@ PYBIND11_MODULE(pybuildify, m) {
         .def_readwrite("x", &utils::Vector3<float>::x)
         .def_readwrite("y", &utils::Vector3<float>::y)
         .def_readwrite("z", &utils::Vector3<float>::z)
-        .def("__add__", &utils::Vector3<float>::operator+)
-        .def("__sub__", &utils::Vector3<float>::operator-)
-        .def("__mul__", &utils::Vector3<float>::operator*)
+        .def("__add__", &utils::Vector3<float>::operator+, py::is_operator())
+        .def("__sub__", &utils::Vector3<float>::operator-, py::is_operator())
+        .def("__mul__", &utils::Vector3<float>::operator*, py::is_operator())
         .def("dot", &utils::Vector3<float>::dot)
         .def("cross", &utils::Vector3<float>::cross)
         .def("length", &utils::Vector3<float>::length)
         .def("normalized", &utils::Vector3<float>::normalized)
+        .def_static("from_array", [](py::array_t<float, py::array::c_style | py::array::forcecast> coords) {
+            auto buf = coords.request();
+            if (buf.ndim != 2 || buf.shape[1] != 3) {
+                throw std::invalid_argument("from_array expects an array of shape (N, 3)");
+            }
+            auto count = static_cast<std::size_t>(buf.shape[0]);
+            std::vector<utils::Vector3<float>> vectors(count);
+            {
+                // Vector3<float> is three contiguous floats, so one memcpy
+                // replaces N Python-side constructor calls.
+                py::gil_scoped_release release;
+                std::memcpy(vectors.data(), buf.ptr, count * sizeof(utils::Vector3<float>));
+            }
+            return vectors;
+        }, py::arg("coords"), "Batch-construct Vector3 objects from an (N, 3) float array")
         .def("__repr__", [](const utils::Vector3<float>& v) {
             return std::format("Vector3({}, {}, {})", v.x, v.y, v.z);
         });
@@ -41,6 +84,10 @@ PYBIND11_MODULE(pybuildify, m) {
         .def_readwrite("position", &utils::Transform::position)
         .def_readwrite("rotation", &utils::Transform::rotation)
         .def_readwrite("scale", &utils::Transform::scale)
+        .def("set_prs", [](utils::Transform& transform,
+                           py::array_t<float, py::array::c_style | py::array::forcecast> prs) {
+            transform = transform_from_prs(std::move(prs));
+        }, py::arg("prs"), "Set position, rotation and scale from one packed (10,) float array")
         .def("to_matrix", &utils::Transform::to_matrix);
 
     py::class_<utils::Quaternion<float>>(utils, "Quaternion")
@@ -62,7 +109,14 @@ PYBIND11_MODULE(pybuildify, m) {
         .def_static("rotation_z", &utils::Matrix4<float>::rotation_z)
         .def_static("scale", &utils::Matrix4<float>::scale)
         .def_static("perspective", &utils::Matrix4<float>::perspective)
-        .def("__mul__", static_cast<utils::Matrix4<float>(utils::Matrix4<float>::*)(const utils::Matrix4<float>&) const>(&utils::Matrix4<float>::operator*));
+        .def("__mul__", static_cast<utils::Matrix4<float>(utils::Matrix4<float>::*)(const utils::Matrix4<float>&) const>(&utils::Matrix4<float>::operator*), py::is_operator())
+        .def("as_numpy", [](py::object self) {
+            // Non-owning (4, 4) float32 view over the matrix storage;
+            // self as base keeps the Matrix4 alive while the view exists
+            auto& mat = self.cast<utils::Matrix4<float>&>();
+            return py::array_t<float>({4, 4}, {4 * sizeof(float), sizeof(float)},
+                                      &mat.m[0][0], self);
+        });
 
     py::enum_<utils::LogLevel>(utils, "LogLevel")
         .value("Trace", utils::LogLevel::Trace)
@@ -76,25 +130,113 @@ PYBIND11_MODULE(pybuildify, m) {
         utils::Logger::instance().set_level(level);
     });
 
+    utils.def("vec3_batch_ops", [](py::array_t<float, py::array::c_style | py::array::forcecast> a,
+                                   py::array_t<float, py::array::c_style | py::array::forcecast> b) {
+        auto abuf = a.request();
+        auto bbuf = b.request();
+        if (abuf.ndim != 2 || abuf.shape[1] != 3 || bbuf.ndim != 2 || bbuf.shape[1] != 3) {
+            throw std::invalid_argument("vec3_batch_ops expects two arrays of shape (N, 3)");
+        }
+        if (abuf.shape[0] != bbuf.shape[0]) {
+            throw std::invalid_argument("vec3_batch_ops inputs must have the same length");
+        }
+        auto count = static_cast<std::size_t>(abuf.shape[0]);
+
+        py::array_t<float> sum({count, std::size_t{3}});
+        py::array_t<float> dot(count);
+        py::array_t<float> cross({count, std::size_t{3}});
+        py::array_t<float> length(count);
+
+        auto* sum_ptr = static_cast<float*>(sum.request().ptr);
+        auto* dot_ptr = static_cast<float*>(dot.request().ptr);
+        auto* cross_ptr = static_cast<float*>(cross.request().ptr);
+        auto* length_ptr = static_cast<float*>(length.request().ptr);
+        {
+            py::gil_scoped_release release;
+            utils::vec3_batch_ops_dispatch(static_cast<const float*>(abuf.ptr),
+                                           static_cast<const float*>(bbuf.ptr),
+                                           count, sum_ptr, dot_ptr, cross_ptr, length_ptr);
+        }
+        return py::make_tuple(sum, dot, cross, length);
+    }, py::arg("a"), py::arg("b"),
+       "Compute sum, dot, cross and length for (N, 3) vector batches in one call");
+
+    utils.def("transforms_to_matrices", [](py::array_t<float, py::array::c_style | py::array::forcecast> positions,
+                                           py::array_t<float, py::array::c_style | py::array::forcecast> quats,
+                                           py::array_t<float, py::array::c_style | py::array::forcecast> scales) {
+        auto pbuf = positions.request();
+        auto qbuf = quats.request();
+        auto sbuf = scales.request();
+        if (pbuf.ndim != 2 || pbuf.shape[1] != 3 ||
+            qbuf.ndim != 2 || qbuf.shape[1] != 4 ||
+            sbuf.ndim != 2 || sbuf.shape[1] != 3) {
+            throw std::invalid_argument("transforms_to_matrices expects (N, 3), (N, 4), (N, 3) arrays");
+        }
+        if (pbuf.shape[0] != qbuf.shape[0] || pbuf.shape[0] != sbuf.shape[0]) {
+            throw std::invalid_argument("transforms_to_matrices inputs must have the same length");
+        }
+        auto count = static_cast<std::size_t>(pbuf.shape[0]);
+
+        py::array_t<float> matrices({count, std::size_t{4}, std::size_t{4}});
+        auto* out = static_cast<float*>(matrices.request().ptr);
+        {
+            py::gil_scoped_release release;
+            utils::transforms_to_matrices_dispatch(static_cast<const float*>(pbuf.ptr),
+                                                   static_cast<const float*>(qbuf.ptr),
+                                                   static_cast<const float*>(sbuf.ptr),
+                                                   count, out);
+        }
+        return matrices;
+    }, py::arg("positions"), py::arg("quats"), py::arg("scales"),
+       "Fused translate*rotate*scale producing an (N, 4, 4) matrix batch");
+
     py::module_ core = m.def_submodule("core", "Core engine classes");
 
     py::class_<core::Engine>(core, "Engine")
         .def(py::init<>())
-        .def("initialize", &core::Engine::initialize, py::arg("config_path") = "")
-        .def("shutdown", &core::Engine::shutdown)
-        .def("update", &core::Engine::update)
+        // Setup, teardown and the per-frame entry points never call back
+        // into Python on their own, so other Python threads (logging,
+        // telemetry) keep running while they execute; Python callbacks
+        // re-acquire the GIL inside the wrapper below.
+        .def("initialize", &core::Engine::initialize, py::arg("config_path") = "",
+             py::call_guard<py::gil_scoped_release>())
+        .def("shutdown", &core::Engine::shutdown,
+             py::call_guard<py::gil_scoped_release>())
+        .def("update", &core::Engine::update,
+             py::call_guard<py::gil_scoped_release>())
+        // The GIL is dropped for the whole batch
+        .def("update_n", &core::Engine::update_n,
+             py::arg("delta_time"), py::arg("frames"),
+             py::call_guard<py::gil_scoped_release>(),
+             "Run a batch of fixed-step updates with one binding crossing")
         .def("render", &core::Engine::render)
         .def("create_scene", &core::Engine::create_scene)
         .def("get_scene", &core::Engine::get_scene)
         .def("set_active_scene", &core::Engine::set_active_scene)
         .def("is_running", &core::Engine::is_running)
         .def("stop", &core::Engine::stop)
-        .def("add_update_callback", [](core::Engine& engine, py::function callback) {
+        .def("add_update_callback", [](core::Engine& engine, py::function callback,
+                                       std::uint64_t every_n) {
+            // The rate limit is checked in C++, so skipped frames never
+            // re-acquire the GIL or call into Python at all
             engine.add_update_callback([callback](double dt) {
                 py::gil_scoped_acquire acquire;
                 callback(dt);
-            });
-        });
+            }, every_n);
+        }, py::arg("callback"), py::arg("every_n") = 1)
+        .def("add_update_callback_raw", [](core::Engine& engine, std::uintptr_t fn_ptr,
+                                           std::uint64_t every_n) {
+            // Native callbacks (a numba @cfunc address or a ctypes
+            // function pointer) skip the interpreter entirely: no GIL
+            // acquisition and no PyObject_Call per frame, so they stay
+            // cheap inside update_n batches.
+            auto* fn = reinterpret_cast<void (*)(double)>(fn_ptr);
+            if (fn == nullptr) {
+                throw std::invalid_argument("add_update_callback_raw: null function pointer");
+            }
+            engine.add_update_callback([fn](double dt) { fn(dt); }, every_n);
+        }, py::arg("fn_ptr"), py::arg("every_n") = 1,
+           "Register a native void(double) callback by address; runs without touching the GIL");
 
     py::class_<core::Entity, std::shared_ptr<core::Entity>>(core, "Entity")
         .def(py::init<const std::string&>(), py::arg("name") = "")
@@ -102,26 +244,148 @@ PYBIND11_MODULE(pybuildify, m) {
         .def("set_name", &core::Entity::set_name)
         .def("get_transform", static_cast<const utils::Transform&(core::Entity::*)() const>(&core::Entity::get_transform), py::return_value_policy::reference)
         .def("set_transform", &core::Entity::set_transform)
+        .def("set_prs", [](core::Entity& entity,
+                           py::array_t<float, py::array::c_style | py::array::forcecast> prs) {
+            entity.set_transform(transform_from_prs(std::move(prs)));
+        }, py::arg("prs"), "Set the full transform from one packed (10,) float array")
         .def("update", &core::Entity::update);
 
     py::class_<core::Camera, core::Entity, std::shared_ptr<core::Camera>>(core, "Camera")
         .def(py::init<const std::string&>(), py::arg("name") = "Camera")
         .def("set_perspective", &core::Camera::set_perspective)
         .def("set_orthographic", &core::Camera::set_orthographic)
-        .def("get_view_matrix", &core::Camera::get_view_matrix)
-        .def("get_projection_matrix", &core::Camera::get_projection_matrix)
-        .def("look_at", &core::Camera::look_at, py::arg("target"), py::arg("up") = utils::Vector3<float>{0, 1, 0});
+        // Zero-copy (4, 4) float32 views over the camera's matrix caches:
+        // no Matrix4 PyObject, no copy, just a handle whose base keeps the
+        // camera alive
+        .def("get_view_matrix", [](py::object self) {
+            auto& camera = self.cast<core::Camera&>();
+            const auto& m = camera.get_view_matrix();
+            return py::array_t<float>({4, 4}, {4 * sizeof(float), sizeof(float)},
+                                      &m.m[0][0], self);
+        })
+        .def("get_projection_matrix", [](py::object self) {
+            auto& camera = self.cast<core::Camera&>();
+            const auto& m = camera.get_projection_matrix();
+            return py::array_t<float>({4, 4}, {4 * sizeof(float), sizeof(float)},
+                                      &m.m[0][0], self);
+        })
+        .def("look_at", &core::Camera::look_at, py::arg("target"), py::arg("up") = utils::Vector3<float>{0, 1, 0})
+        .def("configure", &core::Camera::configure,
+             py::arg("fov"), py::arg("aspect_ratio"), py::arg("near"), py::arg("far"),
+             py::arg("eye"), py::arg("target"),
+             py::arg("up") = utils::Vector3<float>{0, 1, 0},
+             "Fused perspective + placement + look-at; fills both matrix caches in one call");
 
     py::class_<core::Scene, std::shared_ptr<core::Scene>>(core, "Scene")
         .def(py::init<const std::string&>())
         .def("get_name", &core::Scene::get_name)
         .def("set_name", &core::Scene::set_name)
         .def("add_entity", &core::Scene::add_entity)
+        .def("add_entities", &core::Scene::add_entities,
+             "Add a batch of entities with a single binding crossing")
+        .def("create_entities", [](core::Scene& scene, std::vector<std::string> names,
+                                   py::array_t<float, py::array::c_style | py::array::forcecast> positions) {
+            auto buf = positions.request();
+            if (buf.ndim != 2 || buf.shape[1] != 3) {
+                throw std::invalid_argument("create_entities expects positions of shape (N, 3)");
+            }
+            if (static_cast<std::size_t>(buf.shape[0]) != names.size()) {
+                throw std::invalid_argument("create_entities needs one position per name");
+            }
+            const auto* pos = static_cast<const float*>(buf.ptr);
+
+            std::vector<std::shared_ptr<core::Entity>> entities;
+            entities.reserve(names.size());
+            {
+                py::gil_scoped_release release;
+                for (std::size_t i = 0; i < names.size(); ++i) {
+                    auto entity = std::make_shared<core::Entity>(std::move(names[i]));
+                    entity->get_transform().position = {pos[i * 3], pos[i * 3 + 1], pos[i * 3 + 2]};
+                    entities.push_back(std::move(entity));
+                }
+                scene.add_entities(entities);
+            }
+            return entities;
+        }, py::arg("names"), py::arg("positions"),
+           "Construct, place and insert a batch of entities in one C++ loop")
+        .def("batch_read", [](core::Scene&, const std::string& field,
+                              const std::vector<std::shared_ptr<core::Entity>>& entities) {
+            const std::size_t width = (field == "rotation") ? 4 : 3;
+            if (field != "position" && field != "rotation" && field != "scale") {
+                throw std::invalid_argument("batch_read: unknown transform field '" + field + "'");
+            }
+            auto count = entities.size();
+            py::array_t<float> values({count, width});
+            auto* out = static_cast<float*>(values.request().ptr);
+            {
+                py::gil_scoped_release release;
+                for (std::size_t i = 0; i < count; ++i) {
+                    const auto& t = entities[i]->get_transform();
+                    if (field == "position") {
+                        out[i * 3] = t.position.x; out[i * 3 + 1] = t.position.y; out[i * 3 + 2] = t.position.z;
+                    } else if (field == "scale") {
+                        out[i * 3] = t.scale.x; out[i * 3 + 1] = t.scale.y; out[i * 3 + 2] = t.scale.z;
+                    } else {
+                        out[i * 4] = t.rotation.x; out[i * 4 + 1] = t.rotation.y;
+                        out[i * 4 + 2] = t.rotation.z; out[i * 4 + 3] = t.rotation.w;
+                    }
+                }
+            }
+            return values;
+        }, py::arg("field"), py::arg("entities"),
+           "Gather a transform field ('position', 'rotation', 'scale') for a batch of entities")
+        .def("batch_write", [](core::Scene&, const std::string& field,
+                               const std::vector<std::shared_ptr<core::Entity>>& entities,
+                               py::array_t<float, py::array::c_style | py::array::forcecast> values) {
+            const std::size_t width = (field == "rotation") ? 4 : 3;
+            if (field != "position" && field != "rotation" && field != "scale") {
+                throw std::invalid_argument("batch_write: unknown transform field '" + field + "'");
+            }
+            auto buf = values.request();
+            if (buf.ndim != 2 || static_cast<std::size_t>(buf.shape[1]) != width ||
+                static_cast<std::size_t>(buf.shape[0]) != entities.size()) {
+                throw std::invalid_argument("batch_write: values must have shape (len(entities), field width)");
+            }
+            const auto* in = static_cast<const float*>(buf.ptr);
+            {
+                py::gil_scoped_release release;
+                for (std::size_t i = 0; i < entities.size(); ++i) {
+                    // Write through set_transform so virtual overrides run
+                    // (Camera dirties its view cache there); one virtual
+                    // call per entity is noise next to the saved crossings.
+                    auto t = entities[i]->get_transform();
+                    if (field == "position") {
+                        t.position = {in[i * 3], in[i * 3 + 1], in[i * 3 + 2]};
+                    } else if (field == "scale") {
+                        t.scale = {in[i * 3], in[i * 3 + 1], in[i * 3 + 2]};
+                    } else {
+                        t.rotation = {in[i * 4], in[i * 4 + 1], in[i * 4 + 2], in[i * 4 + 3]};
+                    }
+                    entities[i]->set_transform(t);
+                }
+            }
+        }, py::arg("field"), py::arg("entities"), py::arg("values"),
+           "Scatter a transform field to a batch of entities from an (N, width) array")
+        .def("reserve", &core::Scene::reserve, py::arg("capacity"),
+             "Reserve entity storage ahead of a known batch of additions")
         .def("remove_entity", &core::Scene::remove_entity)
         .def("find_entity", &core::Scene::find_entity)
+        .def("find_entities", [](const core::Scene& scene,
+                                 const std::vector<std::string>& names) {
+            // Resolve N names against the hashed index in one binding
+            // crossing; missing names come back as None, matching
+            // find_entity.
+            py::list found;
+            for (const auto& name : names) {
+                found.append(py::cast(scene.find_entity(name)));
+            }
+            return found;
+        }, py::arg("names"), "Look up a batch of entities by name in one call")
         .def("set_active_camera", &core::Scene::set_active_camera)
         .def("get_active_camera", &core::Scene::get_active_camera)
-        .def("update", &core::Scene::update)
+        // Scene::update never re-enters Python, so other threads can run
+        // while the C++ side walks the entities.
+        .def("update", &core::Scene::update, py::call_guard<py::gil_scoped_release>())
         .def("load_from_file", &core::Scene::load_from_file)
         .def("save_to_file", &core::Scene::save_to_file)
 #ifdef WITH_BLENDER
@@ -140,8 +404,10 @@ PYBIND11_MODULE(pybuildify, m) {
 
     py::class_<core::OpenGLRenderer, core::Renderer>(core, "OpenGLRenderer")
         .def(py::init<>())
-        .def("initialize", &core::OpenGLRenderer::initialize)
-        .def("shutdown", &core::OpenGLRenderer::shutdown)
+        .def("initialize", &core::OpenGLRenderer::initialize,
+             py::call_guard<py::gil_scoped_release>())
+        .def("shutdown", &core::OpenGLRenderer::shutdown,
+             py::call_guard<py::gil_scoped_release>())
         .def("begin_frame", &core::OpenGLRenderer::begin_frame)
         .def("end_frame", &core::OpenGLRenderer::end_frame)
         .def("render_scene", &core::OpenGLRenderer::render_scene)
@@ -8,73 +8,55 @@ import buildify
 import time
 import statistics
 
+import numpy as np
+
 def benchmark_vector_operations(iterations=100000):
     """벡터 연산 성능 테스트"""
     print(f"🧮 벡터 연산 벤치마크 ({iterations:,}회 반복)")
     
-    # 벡터 생성
-    vectors = []
+    # 벡터 생성 (좌표를 NumPy 버퍼 하나로 만들어 한 번에 전달)
     start_time = time.time()
-    
-    for i in range(iterations):
-        v = buildify.utils.Vector3(i, i+1, i+2)
-        vectors.append(v)
-    
+
+    xs = np.arange(iterations, dtype=np.float32)
+    coords = np.stack([xs, xs + 1, xs + 2], axis=1)
+    vectors = buildify.utils.Vector3.from_array(coords)
+
     creation_time = time.time() - start_time
     
-    # 벡터 연산
+    # 벡터 연산 (SoA 배치 커널 호출 한 번으로 처리)
     start_time = time.time()
-    results = []
-    
-    for i in range(len(vectors) - 1):
-        v1 = vectors[i]
-        v2 = vectors[i + 1]
-        
-        # 다양한 연산 수행
-        sum_v = v1 + v2
-        dot = v1.dot(v2)
-        cross = v1.cross(v2)
-        length = v1.length()
-        
-        results.append((sum_v, dot, cross, length))
-    
+
+    sums, dots, crosses, lengths = buildify.utils.vec3_batch_ops(coords[:-1], coords[1:])
+
     operation_time = time.time() - start_time
-    
+
     print(f"  벡터 생성: {creation_time:.3f}초 ({iterations/creation_time:.0f} 벡터/초)")
-    print(f"  벡터 연산: {operation_time:.3f}초 ({len(results)/operation_time:.0f} 연산/초)")
+    print(f"  벡터 연산: {operation_time:.3f}초 ({len(dots)/operation_time:.0f} 연산/초)")
     print()
 
 def benchmark_transform_matrix(iterations=50000):
     """변환 행렬 성능 테스트"""
     print(f"📐 변환 행렬 벤치마크 ({iterations:,}회 반복)")
     
-    transforms = []
-    
-    # Transform 객체 생성
+    # Transform SoA 버퍼 구성
     start_time = time.time()
-    
-    for i in range(iterations):
-        transform = buildify.utils.Transform()
-        transform.position = buildify.utils.Vector3(i, i*2, i*3)
-        transform.scale = buildify.utils.Vector3(1.5, 1.5, 1.5)
-        
-        # 회전 설정
-        axis = buildify.utils.Vector3(0, 1, 0)
-        angle = (i % 360) * 3.14159 / 180
-        transform.rotation = buildify.utils.Quaternion.from_axis_angle(axis, angle)
-        
-        transforms.append(transform)
-    
+
+    idx = np.arange(iterations, dtype=np.float32)
+    positions = np.stack([idx, idx * 2, idx * 3], axis=1)
+    scales = np.full((iterations, 3), 1.5, dtype=np.float32)
+
+    # y축 회전 쿼터니언 (x, y, z, w)
+    angles = (np.arange(iterations) % 360) * 3.14159 / 180
+    half_angles = (angles * 0.5).astype(np.float32)
+    quats = np.zeros((iterations, 4), dtype=np.float32)
+    quats[:, 1] = np.sin(half_angles)
+    quats[:, 3] = np.cos(half_angles)
+
     setup_time = time.time() - start_time
-    
-    # 행렬 계산
+
+    # 행렬 계산 (융합 배치 커널 호출 한 번)
     start_time = time.time()
-    matrices = []
-    
-    for transform in transforms:
-        matrix = transform.to_matrix()
-        matrices.append(matrix)
-    
+    matrices = buildify.utils.transforms_to_matrices(positions, quats, scales)
     matrix_time = time.time() - start_time
     
     print(f"  Transform 설정: {setup_time:.3f}초 ({iterations/setup_time:.0f} 설정/초)")
@@ -90,21 +72,14 @@ def benchmark_scene_management(num_entities=1000):
     engine.initialize()
     scene = engine.create_scene("BenchmarkScene")
     
-    # 엔티티 생성 및 추가
+    # 엔티티 생성 및 추가 (일괄 호출 한 번)
     start_time = time.time()
-    entities = []
-    
-    for i in range(num_entities):
-        entity = buildify.core.Entity(f"Entity_{i}")
-        
-        # 변환 설정
-        transform = entity.get_transform()
-        transform.position = buildify.utils.Vector3(i % 100, (i // 100) % 100, i // 10000)
-        entity.set_transform(transform)
-        
-        scene.add_entity(entity)
-        entities.append(entity)
-    
+
+    idx = np.arange(num_entities, dtype=np.float32)
+    positions = np.stack([idx % 100, (idx // 100) % 100, idx // 10000], axis=1)
+    names = [f"Entity_{i}" for i in range(num_entities)]
+    entities = scene.create_entities(names, positions)
+
     creation_time = time.time() - start_time
     
     # 엔티티 검색 성능
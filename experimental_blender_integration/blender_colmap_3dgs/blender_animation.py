@@ -6,53 +6,191 @@ from mathutils import Matrix, Vector, Quaternion
 from typing import List, Tuple, Optional
 from pathlib import Path
 
+try:
+    import numba
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _pack_xyz(points, out):
+        """(N, 3) float32 배열을 foreach_set용 평탄 버퍼로 병렬 패킹"""
+        for i in numba.prange(points.shape[0]):
+            out[3 * i] = points[i, 0]
+            out[3 * i + 1] = points[i, 1]
+            out[3 * i + 2] = points[i, 2]
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _mats_to_quats(m, out):
+        """(N, 3, 3) 회전 행렬 배치를 (N, 4) w,x,y,z 쿼터니언으로 병렬 변환"""
+        for i in numba.prange(m.shape[0]):
+            m00, m11, m22 = m[i, 0, 0], m[i, 1, 1], m[i, 2, 2]
+            trace = m00 + m11 + m22
+            if trace > 0:
+                s = np.sqrt(trace + 1.0) * 2
+                out[i, 0] = 0.25 * s
+                out[i, 1] = (m[i, 2, 1] - m[i, 1, 2]) / s
+                out[i, 2] = (m[i, 0, 2] - m[i, 2, 0]) / s
+                out[i, 3] = (m[i, 1, 0] - m[i, 0, 1]) / s
+            elif m00 >= m11 and m00 >= m22:
+                s = np.sqrt(1.0 + m00 - m11 - m22) * 2
+                out[i, 0] = (m[i, 2, 1] - m[i, 1, 2]) / s
+                out[i, 1] = 0.25 * s
+                out[i, 2] = (m[i, 0, 1] + m[i, 1, 0]) / s
+                out[i, 3] = (m[i, 0, 2] + m[i, 2, 0]) / s
+            elif m11 >= m22:
+                s = np.sqrt(1.0 + m11 - m00 - m22) * 2
+                out[i, 0] = (m[i, 0, 2] - m[i, 2, 0]) / s
+                out[i, 1] = (m[i, 0, 1] + m[i, 1, 0]) / s
+                out[i, 2] = 0.25 * s
+                out[i, 3] = (m[i, 1, 2] + m[i, 2, 1]) / s
+            else:
+                s = np.sqrt(1.0 + m22 - m00 - m11) * 2
+                out[i, 0] = (m[i, 1, 0] - m[i, 0, 1]) / s
+                out[i, 1] = (m[i, 0, 2] + m[i, 2, 0]) / s
+                out[i, 2] = (m[i, 1, 2] + m[i, 2, 1]) / s
+                out[i, 3] = 0.25 * s
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# 서브샘플링용 Generator (레거시 np.random.choice보다 훨씬 빠름)
+_rng = np.random.default_rng()
+
 
 def clear_scene():
-    """Clear all objects from the current Blender scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    """Clear all objects from the current Blender scene.
+
+    Removes datablocks directly instead of going through select_all +
+    delete operators, which validate context, iterate selection and push
+    undo per call. Orphaned meshes/materials/images are purged too so
+    they don't accumulate across repeated runs.
+    """
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for block_list in (bpy.data.meshes, bpy.data.materials, bpy.data.images):
+        for block in list(block_list):
+            if block.users == 0:
+                block_list.remove(block)
+
+
+def _rotation_matrices_to_quaternions(matrices: np.ndarray) -> np.ndarray:
+    """Convert a batch of (N, 3, 3) rotation matrices to (N, 4) quaternions.
+
+    Returns (w, x, y, z) per row, matching Blender's rotation_quaternion
+    order. Uses Shepperd's method, branching on the largest diagonal term
+    for numerical stability. Runs as a parallel Numba kernel when numba is
+    installed, otherwise fully vectorized numpy over the batch.
+    """
+    m = np.ascontiguousarray(matrices, dtype=np.float64)
+    n = m.shape[0]
+    quats = np.empty((n, 4), dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        _mats_to_quats(m, quats)
+        return quats
+
+    m00, m11, m22 = m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]
+    trace = m00 + m11 + m22
+
+    case0 = trace > 0
+    case1 = (~case0) & (m00 >= m11) & (m00 >= m22)
+    case2 = (~case0) & (~case1) & (m11 >= m22)
+    case3 = ~(case0 | case1 | case2)
+
+    s = np.empty(n)
+    s[case0] = np.sqrt(trace[case0] + 1.0) * 2
+    quats[case0, 0] = 0.25 * s[case0]
+    quats[case0, 1] = (m[case0, 2, 1] - m[case0, 1, 2]) / s[case0]
+    quats[case0, 2] = (m[case0, 0, 2] - m[case0, 2, 0]) / s[case0]
+    quats[case0, 3] = (m[case0, 1, 0] - m[case0, 0, 1]) / s[case0]
+
+    s[case1] = np.sqrt(1.0 + m00[case1] - m11[case1] - m22[case1]) * 2
+    quats[case1, 0] = (m[case1, 2, 1] - m[case1, 1, 2]) / s[case1]
+    quats[case1, 1] = 0.25 * s[case1]
+    quats[case1, 2] = (m[case1, 0, 1] + m[case1, 1, 0]) / s[case1]
+    quats[case1, 3] = (m[case1, 0, 2] + m[case1, 2, 0]) / s[case1]
+
+    s[case2] = np.sqrt(1.0 + m11[case2] - m00[case2] - m22[case2]) * 2
+    quats[case2, 0] = (m[case2, 0, 2] - m[case2, 2, 0]) / s[case2]
+    quats[case2, 1] = (m[case2, 0, 1] + m[case2, 1, 0]) / s[case2]
+    quats[case2, 2] = 0.25 * s[case2]
+    quats[case2, 3] = (m[case2, 1, 2] + m[case2, 2, 1]) / s[case2]
+
+    s[case3] = np.sqrt(1.0 + m22[case3] - m00[case3] - m11[case3]) * 2
+    quats[case3, 0] = (m[case3, 1, 0] - m[case3, 0, 1]) / s[case3]
+    quats[case3, 1] = (m[case3, 0, 2] + m[case3, 2, 0]) / s[case3]
+    quats[case3, 2] = (m[case3, 1, 2] + m[case3, 2, 1]) / s[case3]
+    quats[case3, 3] = 0.25 * s[case3]
+
+    return quats
 
 
 def create_camera_with_animation(poses: List[Tuple[str, np.ndarray, np.ndarray]],
                                 frame_start: int = 1,
-                                frame_end: Optional[int] = None) -> bpy.types.Object:
-    """Create animated camera following COLMAP trajectory"""
-    if not poses:
+                                frame_end: Optional[int] = None,
+                                rotations: Optional[np.ndarray] = None,
+                                locations: Optional[np.ndarray] = None) -> bpy.types.Object:
+    """Create animated camera following COLMAP trajectory.
+
+    Callers holding SoA pose arrays (COLMAPLoader.get_camera_pose_arrays)
+    can pass rotations (N,3,3) and locations (N,3) directly and skip the
+    per-pose restacking of the tuple list; poses may then be None.
+    """
+    if poses:
+        num_poses = len(poses)
+    elif rotations is not None and locations is not None:
+        num_poses = len(rotations)
+    else:
         raise ValueError("No camera poses provided")
-        
+
     if frame_end is None:
-        frame_end = len(poses)
-    
+        frame_end = num_poses
+
     # Create camera
     bpy.ops.object.camera_add()
     camera = bpy.context.active_object
     camera.name = "COLMAP_Camera"
     camera.rotation_mode = 'QUATERNION'
-    
+
     # Set frame range
     bpy.context.scene.frame_start = frame_start
     bpy.context.scene.frame_end = frame_end
-    
-    # Animate camera
-    for i, (image_name, rotation_matrix, translation) in enumerate(poses):
-        frame = frame_start + i
-        bpy.context.scene.frame_set(frame)
-        
-        # Convert numpy arrays to Blender Matrix and Quaternion
-        mat3 = Matrix(rotation_matrix.tolist())
-        camera.location = Vector(translation)
-        camera.rotation_quaternion = mat3.to_quaternion()
-
-        # Insert keyframes
-        camera.keyframe_insert(data_path="location", frame=frame)
-        camera.keyframe_insert(data_path="rotation_quaternion", frame=frame)
-    
-    # Set interpolation to linear for smoother motion
-    if camera.animation_data and camera.animation_data.action:
-        for fcurve in camera.animation_data.action.fcurves:
-            for keyframe in fcurve.keyframe_points:
-                keyframe.interpolation = 'LINEAR'
-    
+
+    # Convert all rotations to quaternions in one vectorized pass instead
+    # of Matrix(tolist()).to_quaternion() per pose
+    if rotations is None:
+        rotations = np.stack([rotation for _, rotation, _ in poses])
+    quaternions = _rotation_matrices_to_quaternions(rotations)
+
+    # Animate camera: write keyframes straight into fcurves, where
+    # keyframe_points.add(N) + foreach_set is one C call per channel
+    # instead of two RNA keyframe_insert calls per pose
+    if locations is None:
+        locations = np.stack([translation for _, _, translation in poses])
+    locations = locations.astype(np.float64)
+    frames = np.arange(frame_start, frame_start + num_poses, dtype=np.float64)
+
+    camera.animation_data_create()
+    action = bpy.data.actions.new(name=f"{camera.name}_Action")
+    camera.animation_data.action = action
+
+    # keyframe 'interpolation' enum ints: CONSTANT=0, LINEAR=1, BEZIER=2
+    linear = np.full(num_poses, 1, dtype=np.int32)
+    co = np.empty(num_poses * 2, dtype=np.float64)
+    co[0::2] = frames
+
+    for data_path, values in (("location", locations), ("rotation_quaternion", quaternions)):
+        for index in range(values.shape[1]):
+            fcurve = action.fcurves.new(data_path=data_path, index=index)
+            fcurve.keyframe_points.add(num_poses)
+            co[1::2] = values[:, index]
+            fcurve.keyframe_points.foreach_set("co", co)
+            fcurve.keyframe_points.foreach_set("interpolation", linear)
+            fcurve.update()
+
+    # Show the first pose in the viewport
+    camera.location = Vector(locations[0])
+    camera.rotation_quaternion = quaternions[0]
+
     return camera
 
 
@@ -69,17 +207,49 @@ def create_point_cloud_mesh(points: np.ndarray,
         print("No points to create mesh")
         return None
 
-    # Subsample for performance if needed
+    # Subsample for performance if needed; shuffle=False skips the final
+    # permutation since any valid subsample is fine here
     if len(points) > max_points:
-        import numpy as _np
-        idx = _np.random.choice(len(points), max_points, replace=False)
-        points = points[idx]
-        if len(colors) == len(idx):
-            colors = colors[idx]
-
-    # Base mesh with vertices only
+        idx = _rng.choice(len(points), max_points, replace=False, shuffle=False)
+        if len(colors) == len(points):
+            colors = colors.take(idx, axis=0)
+        points = points.take(idx, axis=0)
+
+    # Native PointCloud (Blender 3.1+) first: SoA position/radius/color
+    # buffers, no unused face/loop/edge layers and no instance evaluation
+    if hasattr(bpy.data, 'pointclouds'):
+        try:
+            pc = bpy.data.pointclouds.new(name)
+            pc.points.add(len(points))
+            pc.points.foreach_set(
+                "co", np.ascontiguousarray(points, dtype=np.float32).ravel())
+            radius_attr = pc.attributes.new('radius', 'FLOAT', 'POINT')
+            radius_attr.data.foreach_set(
+                'value', np.full(len(points), point_radius, dtype=np.float32))
+            if len(colors) == len(points):
+                rgba = np.empty((len(points), 4), dtype=np.float32)
+                rgba[:, :3] = colors
+                rgba[:, 3] = 1.0
+                color_attr = pc.attributes.new('color', 'FLOAT_COLOR', 'POINT')
+                color_attr.data.foreach_set('color', rgba.ravel())
+            obj = bpy.data.objects.new(name, pc)
+            bpy.context.collection.objects.link(obj)
+            return obj
+        except Exception as e:
+            print(f"PointCloud API unavailable, using mesh instancing: {e}")
+
+    # Base mesh with vertices only, uploaded as one flat float32 buffer
+    # instead of a Python tuple per point
     mesh = bpy.data.meshes.new(name)
-    mesh.from_pydata([tuple(p) for p in points], [], [])
+    mesh.vertices.add(len(points))
+    coords = np.ascontiguousarray(points, dtype=np.float32)
+    flat = np.empty(len(points) * 3, dtype=np.float32)
+    if NUMBA_AVAILABLE:
+        _pack_xyz(coords, flat)
+    else:
+        flat[:] = coords.ravel()
+    mesh.vertices.foreach_set("co", flat)
+    mesh.update()
     obj = bpy.data.objects.new(name, mesh)
     bpy.context.collection.objects.link(obj)
 
@@ -170,6 +340,31 @@ def setup_camera_properties(camera: bpy.types.Object,
     bpy.context.scene.render.resolution_y = height
 
 
+def get_or_create_image_material(img: bpy.types.Image,
+                                 cache: dict) -> bpy.types.Material:
+    """Return a shared material showing img, building the node tree only once.
+
+    Materials are instanced per unique image so N planes over a handful of
+    images trigger O(unique) shader builds instead of O(N).
+    """
+    material = cache.get(img.name)
+    if material is None:
+        material = bpy.data.materials.new(name=f"Mat_{img.name}")
+        material.use_nodes = True
+        nodes = material.node_tree.nodes
+        links = material.node_tree.links
+
+        tex_node = nodes.new(type='ShaderNodeTexImage')
+        tex_node.image = img
+
+        principled = nodes.get('Principled BSDF')
+        if principled:
+            links.new(tex_node.outputs['Color'], principled.inputs['Base Color'])
+
+        cache[img.name] = material
+    return material
+
+
 def create_image_planes(poses: List[Tuple[str, np.ndarray, np.ndarray]],
                        images_path: str,
                        scale: float = 1.0,
@@ -182,11 +377,18 @@ def create_image_planes(poses: List[Tuple[str, np.ndarray, np.ndarray]],
     """
     image_planes = []
     images_dir = Path(images_path)
-    
+
+    # One iterdir() instead of a stat() per pose (matters on network mounts),
+    # and a datablock cache so duplicated image names decode only once
+    existing_files = set(images_dir.iterdir()) if images_dir.is_dir() else set()
+    image_cache: dict = {}
+    material_cache: dict = {}
+
     for i, (image_name, rotation_matrix, translation) in enumerate(poses):
         image_path = images_dir / image_name
-        
-        if not image_path.exists():
+
+        # Fall back to exists() for names that include subdirectories
+        if image_path not in existing_files and not image_path.exists():
             print(f"Image not found: {image_path}")
             continue
             
@@ -195,13 +397,17 @@ def create_image_planes(poses: List[Tuple[str, np.ndarray, np.ndarray]],
         plane = bpy.context.active_object
         plane.name = f"Image_{i:04d}_{image_name}"
         # Set aspect-correct scale
-        img = None
-        try:
-            img = bpy.data.images.load(str(image_path))
-        except Exception as _e:
-            print(f"Failed to load image: {image_path} ({_e})")
-            bpy.ops.object.delete()
-            continue
+        img = image_cache.get(image_name)
+        if img is None:
+            try:
+                # check_existing reuses the datablock if the same path was
+                # already loaded (e.g. by a previous run in this session)
+                img = bpy.data.images.load(str(image_path), check_existing=True)
+            except Exception as _e:
+                print(f"Failed to load image: {image_path} ({_e})")
+                bpy.ops.object.delete()
+                continue
+            image_cache[image_name] = img
 
         iw, ih = img.size[0], img.size[1]
         aspect = iw / ih if ih else 1.0
@@ -225,37 +431,68 @@ def create_image_planes(poses: List[Tuple[str, np.ndarray, np.ndarray]],
         plane.location = Vector(translation) + forward * forward_offset
         plane.rotation_euler = mat.to_euler()
         
-        # Create material with image texture
-        mat = bpy.data.materials.new(name=f"Mat_{image_name}")
-        mat.use_nodes = True
-        plane.data.materials.append(mat)
-        
-        # Setup shader nodes
-        nodes = mat.node_tree.nodes
-        links = mat.node_tree.links
-        
-        # Add image texture node
-        tex_node = nodes.new(type='ShaderNodeTexImage')
-        tex_node.image = img
-        
-        # Connect to principled shader
-        principled = nodes.get('Principled BSDF')
-        if principled:
-            links.new(tex_node.outputs['Color'], principled.inputs['Base Color'])
-        
+        # Attach the shared material for this image (built on first use)
+        plane.data.materials.append(get_or_create_image_material(img, material_cache))
+
         image_planes.append(plane)
     
     return image_planes
 
 
+# First VIEW_3D space per screen name; the nested areas/spaces scan is
+# pure Python iteration and every scene-setup path repeats it
+_VIEW3D_SPACE_CACHE = {}
+
+
+def get_view3d_space():
+    """Return the first VIEW_3D space of the active screen (cached).
+
+    The cached space is revalidated by touching it — Blender raises
+    ReferenceError on RNA structs whose data was freed (workspace or
+    layout change) — and the scan only reruns when that happens.
+    """
+    screen = bpy.context.screen
+    if screen is None:
+        return None
+
+    cached = _VIEW3D_SPACE_CACHE.get(screen.name)
+    if cached is not None:
+        try:
+            if cached.type == 'VIEW_3D':
+                return cached
+        except ReferenceError:
+            pass
+
+    for area in screen.areas:
+        if area.type == 'VIEW_3D':
+            # spaces.active is the documented fast path; a VIEW_3D area's
+            # active space is always the VIEW_3D space itself
+            space = area.spaces.active
+            _VIEW3D_SPACE_CACHE[screen.name] = space
+            return space
+    _VIEW3D_SPACE_CACHE.pop(screen.name, None)
+    return None
+
+
+def set_view3d(perspective: str = None, shading: str = None):
+    """Apply viewport settings to the cached VIEW_3D space.
+
+    Returns the space so callers can tweak further settings without
+    rescanning the screen areas.
+    """
+    space = get_view3d_space()
+    if space is None:
+        return None
+    if perspective is not None:
+        space.region_3d.view_perspective = perspective
+    if shading is not None:
+        space.shading.type = shading
+    return space
+
+
 def set_viewport_shading(shading_type: str = 'MATERIAL'):
     """Set viewport shading mode"""
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            for space in area.spaces:
-                if space.type == 'VIEW_3D':
-                    space.shading.type = shading_type
-                    break
+    set_view3d(shading=shading_type)
 
 
 def setup_scene_for_visualization():
@@ -293,7 +530,9 @@ class BlenderCOLMAPIntegration:
                    colors: np.ndarray,
                    images_path: str,
                    camera_params: dict = None,
-                   clear_existing: bool = True):
+                   clear_existing: bool = True,
+                   pose_rotations: np.ndarray = None,
+                   pose_locations: np.ndarray = None):
         """Setup complete Blender scene with COLMAP data"""
         
         if clear_existing:
@@ -304,7 +543,8 @@ class BlenderCOLMAPIntegration:
         
         # Create animated camera
         if poses:
-            self.camera = create_camera_with_animation(poses)
+            self.camera = create_camera_with_animation(
+                poses, rotations=pose_rotations, locations=pose_locations)
             
             # Setup camera properties if available
             if camera_params and 'width' in camera_params and 'height' in camera_params:
@@ -326,3 +566,7 @@ class BlenderCOLMAPIntegration:
         # Set active camera
         if self.camera:
             bpy.context.scene.camera = self.camera
+
+        # All creation above goes through bpy.data, which only tags the
+        # depsgraph; evaluate once here instead of between every step
+        bpy.context.view_layer.update()
@@ -1,7 +1,11 @@
 """COLMAP data parsing utilities"""
+import mmap
+import os
 import struct
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, NamedTuple, Tuple, Iterable
+from typing import Dict, List, NamedTuple, Optional, Tuple, Iterable
 import numpy as np
 
 
@@ -31,117 +35,401 @@ class Point3D(NamedTuple):
     point2d_idxs: np.ndarray
 
 
+class ImageTable:
+    """Columnar (SoA) storage for images.bin records.
+
+    Each field lives in one contiguous array (ragged point3d ids in CSR
+    form), so batch consumers slice columns directly instead of
+    restacking per-record arrays. Mapping-style access builds Image
+    NamedTuples lazily for code that wants individual records.
+    """
+
+    def __init__(self, ids: np.ndarray, qvecs: np.ndarray, tvecs: np.ndarray,
+                 camera_ids: np.ndarray, names: List[str],
+                 point3d_indptr: np.ndarray, point3d_data: np.ndarray):
+        self.ids = ids
+        self.qvecs = qvecs
+        self.tvecs = tvecs
+        self.camera_ids = camera_ids
+        self.names = names
+        self.point3d_indptr = point3d_indptr
+        self.point3d_data = point3d_data
+        self._rows = {int(image_id): row for row, image_id in enumerate(ids)}
+
+    def point3d_ids(self, row: int) -> np.ndarray:
+        return self.point3d_data[self.point3d_indptr[row]:self.point3d_indptr[row + 1]]
+
+    def _record(self, row: int) -> Image:
+        return Image(
+            id=int(self.ids[row]),
+            qvec=self.qvecs[row],
+            tvec=self.tvecs[row],
+            camera_id=int(self.camera_ids[row]),
+            name=self.names[row],
+            point3d_ids=self.point3d_ids(row),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, image_id) -> bool:
+        return image_id in self._rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __getitem__(self, image_id) -> Image:
+        return self._record(self._rows[image_id])
+
+    def get(self, image_id, default=None):
+        row = self._rows.get(image_id)
+        return default if row is None else self._record(row)
+
+    def keys(self):
+        return self._rows.keys()
+
+    def values(self) -> List[Image]:
+        return [self._record(row) for row in range(len(self.ids))]
+
+    def items(self) -> List[Tuple[int, Image]]:
+        return [(int(self.ids[row]), self._record(row)) for row in range(len(self.ids))]
+
+
+class Point3DTable:
+    """Columnar (SoA) storage for points3D.bin records.
+
+    Same layout idea as ImageTable: xyz/rgb/error columns plus CSR
+    tracks, with lazy Point3D NamedTuples for per-record access.
+    """
+
+    def __init__(self, ids: np.ndarray, xyzs: np.ndarray, rgbs: np.ndarray,
+                 errors: np.ndarray, track_indptr: np.ndarray,
+                 track_image_ids: np.ndarray = None, track_point2d_idxs: np.ndarray = None,
+                 track_buffer=None, track_offsets: np.ndarray = None):
+        self.ids = ids
+        self.xyzs = xyzs
+        self.rgbs = rgbs
+        self.errors = errors
+        self.track_indptr = track_indptr
+        self.track_image_ids = track_image_ids
+        self.track_point2d_idxs = track_point2d_idxs
+        # Lazy mode: tracks stay in the mapped file and are decoded
+        # per record on first touch (only touched pages hit RAM)
+        self._track_buffer = track_buffer
+        self._track_offsets = track_offsets
+        self._rows = {int(point_id): row for row, point_id in enumerate(ids)}
+
+    def get_track(self, row: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (image_ids, point2d_idxs) for one record.
+
+        Eager tables slice the decoded CSR columns; lazy tables return
+        zero-copy views straight into the mapped file.
+        """
+        if self.track_image_ids is not None:
+            track = slice(self.track_indptr[row], self.track_indptr[row + 1])
+            return self.track_image_ids[track], self.track_point2d_idxs[track]
+        count = int(self.track_indptr[row + 1] - self.track_indptr[row])
+        track = np.frombuffer(self._track_buffer, dtype=_TRACK_DTYPE,
+                              count=count, offset=int(self._track_offsets[row]))
+        return track["image_id"], track["point2d_idx"]
+
+    def _record(self, row: int) -> Point3D:
+        image_ids, point2d_idxs = self.get_track(row)
+        return Point3D(
+            id=int(self.ids[row]),
+            xyz=self.xyzs[row],
+            rgb=self.rgbs[row],
+            error=float(self.errors[row]),
+            image_ids=image_ids,
+            point2d_idxs=point2d_idxs,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, point_id) -> bool:
+        return point_id in self._rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __getitem__(self, point_id) -> Point3D:
+        return self._record(self._rows[point_id])
+
+    def get(self, point_id, default=None):
+        row = self._rows.get(point_id)
+        return default if row is None else self._record(row)
+
+    def keys(self):
+        return self._rows.keys()
+
+    def values(self) -> List[Point3D]:
+        return [self._record(row) for row in range(len(self.ids))]
+
+    def items(self) -> List[Tuple[int, Point3D]]:
+        return [(int(self.ids[row]), self._record(row)) for row in range(len(self.ids))]
+
+
+@lru_cache(maxsize=None)
+def _compiled_struct(format_string: str) -> struct.Struct:
+    """Cache compiled Struct objects so repeated formats skip re-parsing"""
+    return struct.Struct(format_string)
+
+
 def read_next_bytes(fid, num_bytes: int, format_char_sequence: str, endian_character: str = "<"):
     """Read and unpack next bytes from file"""
     data = fid.read(num_bytes)
-    return struct.unpack(endian_character + format_char_sequence, data)
+    return _compiled_struct(endian_character + format_char_sequence).unpack(data)
+
+
+# Structured dtypes for bulk record reads (little-endian, packed). One
+# np.fromfile per record replaces per-field struct.unpack calls and hands
+# back ndarray columns directly, without tuple/list round-trips.
+_POINT3D_HEADER_DTYPE = np.dtype([
+    ("id", "<u8"), ("x", "<f8"), ("y", "<f8"), ("z", "<f8"),
+    ("r", "u1"), ("g", "u1"), ("b", "u1"), ("error", "<f8"),
+])
+_TRACK_DTYPE = np.dtype([("image_id", "<i4"), ("point2d_idx", "<i4")])
+_POINT2D_DTYPE = np.dtype([("x", "<f8"), ("y", "<f8"), ("point3d_id", "<i8")])
+_CAMERA_HEADER_DTYPE = np.dtype([
+    ("id", "<i4"), ("model", "<i4"), ("width", "<u8"), ("height", "<u8"),
+])
+
+# Camera model tables indexed by model_id (hoisted out of the read loop)
+_CAMERA_MODEL_NAMES = (
+    "SIMPLE_PINHOLE", "PINHOLE", "SIMPLE_RADIAL", "RADIAL", "OPENCV",
+    "OPENCV_FISHEYE", "FULL_OPENCV", "FOV", "SIMPLE_RADIAL_FISHEYE",
+    "RADIAL_FISHEYE", "THIN_PRISM_FISHEYE",
+)
+_CAMERA_MODEL_NUM_PARAMS = (3, 4, 4, 5, 8, 8, 12, 5, 4, 5, 12)
+
+assert _POINT3D_HEADER_DTYPE.itemsize == 43  # must match COLMAP's packed layout
+
+# Precompiled Structs for the remaining fixed-size fields
+_UNPACK_UINT64 = struct.Struct("<Q")
+_UNPACK_IMAGE_HEADER = struct.Struct("<idddddddi")
+
+
+def _scan_points3d(buf: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Scan a points3D.bin byte buffer for record offsets and track lengths.
+
+    Only integer fields are touched (manual little-endian assembly), so
+    the loop is numba-jittable; the float/color payloads are decoded in
+    one vectorized pass afterwards.
+    """
+    num_points = np.int64(0)
+    for b in range(8):
+        num_points |= np.int64(buf[b]) << (8 * b)
+
+    offsets = np.empty(num_points, dtype=np.int64)
+    lengths = np.empty(num_points, dtype=np.int64)
+    offset = np.int64(8)
+    for row in range(num_points):
+        offsets[row] = offset
+        offset += 43
+        track_length = np.int64(0)
+        for b in range(8):
+            track_length |= np.int64(buf[offset + b]) << (8 * b)
+        lengths[row] = track_length
+        offset += 8 + track_length * 8
+    return offsets, lengths
+
+
+def _poses_to_blender_kernel(qvecs: np.ndarray, tvecs: np.ndarray,
+                             R_out: np.ndarray, t_out: np.ndarray) -> None:
+    """Fused unit-quaternion -> Blender pose kernel over an (N, 4)/(N, 3) batch.
+
+    Expands the rotation, transposes (world-to-camera -> camera-to-world)
+    and applies the COLMAP->Blender axis swap in one branch-free pass, so
+    the whole pipeline auto-vectorizes to FMAs under numba instead of
+    running as separate einsum stages.
+    """
+    for i in range(qvecs.shape[0]):
+        w, x, y, z = qvecs[i, 0], qvecs[i, 1], qvecs[i, 2], qvecs[i, 3]
+        r00 = 1 - 2 * (y * y + z * z)
+        r01 = 2 * (x * y - z * w)
+        r02 = 2 * (x * z + y * w)
+        r10 = 2 * (x * y + z * w)
+        r11 = 1 - 2 * (x * x + z * z)
+        r12 = 2 * (y * z - x * w)
+        r20 = 2 * (x * z - y * w)
+        r21 = 2 * (y * z + x * w)
+        r22 = 1 - 2 * (x * x + y * y)
+
+        t0, t1, t2 = tvecs[i, 0], tvecs[i, 1], tvecs[i, 2]
+        # t_c2w = -R.T @ t
+        tc0 = -(r00 * t0 + r10 * t1 + r20 * t2)
+        tc1 = -(r01 * t0 + r11 * t1 + r21 * t2)
+        tc2 = -(r02 * t0 + r12 * t1 + r22 * t2)
+
+        # R_blender = C2B @ R.T, t_blender = C2B @ t_c2w
+        R_out[i, 0, 0] = r00; R_out[i, 0, 1] = r10; R_out[i, 0, 2] = r20
+        R_out[i, 1, 0] = -r02; R_out[i, 1, 1] = -r12; R_out[i, 1, 2] = -r22
+        R_out[i, 2, 0] = r01; R_out[i, 2, 1] = r11; R_out[i, 2, 2] = r21
+        t_out[i, 0] = tc0
+        t_out[i, 1] = -tc2
+        t_out[i, 2] = tc1
+
+
+try:
+    import numba
+
+    # Parsing drops out of the interpreter entirely for the scan loop;
+    # cache=True amortizes compilation across sessions
+    _scan_points3d = numba.njit(cache=True)(_scan_points3d)
+    _poses_to_blender_kernel = numba.njit(fastmath=True, cache=True)(
+        _poses_to_blender_kernel)
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _mmap_file(fid) -> mmap.mmap:
+    """Map an open binary file read-only for zero-copy parsing.
+
+    The mapping outlives the file handle; numpy views taken from it keep
+    it alive until the last one is garbage collected.
+    """
+    return mmap.mmap(fid.fileno(), 0, access=mmap.ACCESS_READ)
 
 
 def read_cameras_binary(path_to_model_file: str) -> Dict[int, Camera]:
     """Read COLMAP cameras.bin file"""
     cameras = {}
     with open(path_to_model_file, "rb") as fid:
-        num_cameras = read_next_bytes(fid, 8, "Q")[0]
-        for _ in range(num_cameras):
-            camera_properties = read_next_bytes(fid, 24, "iiQQ")
-            camera_id = camera_properties[0]
-            model_id = camera_properties[1]
-            model_name = {
-                0: "SIMPLE_PINHOLE",
-                1: "PINHOLE", 
-                2: "SIMPLE_RADIAL",
-                3: "RADIAL",
-                4: "OPENCV",
-                5: "OPENCV_FISHEYE",
-                6: "FULL_OPENCV",
-                7: "FOV",
-                8: "SIMPLE_RADIAL_FISHEYE",
-                9: "RADIAL_FISHEYE",
-                10: "THIN_PRISM_FISHEYE"
-            }.get(model_id, "UNKNOWN")
-            
-            width = camera_properties[2]
-            height = camera_properties[3]
-            
-            num_params = {
-                0: 3, 1: 4, 2: 4, 3: 5, 4: 8, 5: 8, 6: 12, 7: 5, 8: 4, 9: 5, 10: 12
-            }.get(model_id, 0)
-            
-            params = read_next_bytes(fid, 8*num_params, "d"*num_params)
-            cameras[camera_id] = Camera(
-                id=camera_id,
-                model=model_name,
-                width=int(width),
-                height=int(height),
-                params=np.array(params)
-            )
+        mm = _mmap_file(fid)
+
+    (num_cameras,) = _UNPACK_UINT64.unpack_from(mm, 0)
+    offset = _UNPACK_UINT64.size
+    for _ in range(num_cameras):
+        header = np.frombuffer(mm, dtype=_CAMERA_HEADER_DTYPE, count=1, offset=offset)[0]
+        offset += _CAMERA_HEADER_DTYPE.itemsize
+        camera_id = int(header["id"])
+        model_id = int(header["model"])
+
+        in_range = 0 <= model_id < len(_CAMERA_MODEL_NAMES)
+        model_name = _CAMERA_MODEL_NAMES[model_id] if in_range else "UNKNOWN"
+        num_params = _CAMERA_MODEL_NUM_PARAMS[model_id] if in_range else 0
+
+        params = np.frombuffer(mm, dtype="<f8", count=num_params,
+                               offset=offset).astype(np.float32)
+        offset += num_params * 8
+        cameras[camera_id] = Camera(
+            id=camera_id,
+            model=model_name,
+            width=int(header["width"]),
+            height=int(header["height"]),
+            params=params
+        )
     return cameras
 
 
-def read_images_binary(path_to_model_file: str) -> Dict[int, Image]:
-    """Read COLMAP images.bin file"""
-    images = {}
+def read_images_binary(path_to_model_file: str) -> ImageTable:
+    """Read COLMAP images.bin file into columnar storage"""
     with open(path_to_model_file, "rb") as fid:
-        num_reg_images = read_next_bytes(fid, 8, "Q")[0]
-        for _ in range(num_reg_images):
-            binary_image_properties = read_next_bytes(fid, 64, "idddddddi")
-            image_id = binary_image_properties[0]
-            qvec = np.array(binary_image_properties[1:5])
-            tvec = np.array(binary_image_properties[5:8])
-            camera_id = binary_image_properties[8]
-            
-            image_name = ""
-            current_char = read_next_bytes(fid, 1, "c")[0]
-            while current_char != b"\x00":
-                image_name += current_char.decode("utf-8")
-                current_char = read_next_bytes(fid, 1, "c")[0]
-            
-            num_points2d = read_next_bytes(fid, 8, "Q")[0]
-            x_y_id_s = read_next_bytes(fid, 24*num_points2d, "ddq"*num_points2d)
-            point3d_ids = np.array(tuple(map(int, x_y_id_s[2::3])))
-            
-            images[image_id] = Image(
-                id=image_id,
-                qvec=qvec,
-                tvec=tvec,
-                camera_id=camera_id,
-                name=image_name,
-                point3d_ids=point3d_ids
-            )
-    return images
+        mm = _mmap_file(fid)
+
+    (num_reg_images,) = _UNPACK_UINT64.unpack_from(mm, 0)
+    offset = _UNPACK_UINT64.size
+
+    ids = np.empty(num_reg_images, dtype=np.int32)
+    # float32 halves the bytes every batched consumer moves; pose math
+    # promotes to float64 internally where stability matters
+    qvecs = np.empty((num_reg_images, 4), dtype=np.float32)
+    tvecs = np.empty((num_reg_images, 3), dtype=np.float32)
+    camera_ids = np.empty(num_reg_images, dtype=np.int32)
+    names: List[str] = [""] * num_reg_images
+    tracks: List[np.ndarray] = []
 
+    for row in range(num_reg_images):
+        properties = _UNPACK_IMAGE_HEADER.unpack_from(mm, offset)
+        offset += _UNPACK_IMAGE_HEADER.size
+        ids[row] = properties[0]
+        qvecs[row] = properties[1:5]
+        tvecs[row] = properties[5:8]
+        camera_ids[row] = properties[8]
 
-def read_points3d_binary(path_to_model_file: str) -> Dict[int, Point3D]:
-    """Read COLMAP points3D.bin file"""
-    points3d = {}
+        # One memchr instead of a byte-at-a-time read loop
+        name_end = mm.find(b"\x00", offset)
+        names[row] = mm[offset:name_end].decode("utf-8")
+        offset = name_end + 1
+
+        (num_points2d,) = _UNPACK_UINT64.unpack_from(mm, offset)
+        offset += _UNPACK_UINT64.size
+        points2d = np.frombuffer(mm, dtype=_POINT2D_DTYPE, count=num_points2d, offset=offset)
+        offset += num_points2d * _POINT2D_DTYPE.itemsize
+        tracks.append(points2d["point3d_id"])
+
+    lengths = np.array([len(track) for track in tracks], dtype=np.int64)
+    indptr = np.zeros(num_reg_images + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+    if tracks:
+        data = np.concatenate(tracks).astype(np.int32, copy=False)
+    else:
+        data = np.empty(0, dtype=np.int32)
+
+    return ImageTable(ids, qvecs, tvecs, camera_ids, names, indptr, data)
+
+
+def read_points3d_binary(path_to_model_file: str, lazy_tracks: bool = False) -> Point3DTable:
+    """Read COLMAP points3D.bin file into columnar storage.
+
+    With lazy_tracks=True only the fixed-size header columns are decoded;
+    track data stays in the mapped file and Point3DTable.get_track reads
+    individual records zero-copy, so consumers that touch a subset of
+    points never pull the full track region into RAM.
+    """
     with open(path_to_model_file, "rb") as fid:
-        num_points = read_next_bytes(fid, 8, "Q")[0]
-        for _ in range(num_points):
-            binary_point_line_properties = read_next_bytes(fid, 43, "QdddBBBd")
-            point3d_id = binary_point_line_properties[0]
-            xyz = np.array(binary_point_line_properties[1:4])
-            rgb = np.array(binary_point_line_properties[4:7])
-            error = binary_point_line_properties[7]
-            
-            track_length = read_next_bytes(fid, 8, "Q")[0]
-            track_elems = read_next_bytes(fid, 8*track_length, "ii"*track_length)
-            image_ids = np.array(tuple(map(int, track_elems[0::2])))
-            point2d_idxs = np.array(tuple(map(int, track_elems[1::2])))
-            
-            points3d[point3d_id] = Point3D(
-                id=point3d_id,
-                xyz=xyz,
-                rgb=rgb,
-                error=error,
-                image_ids=image_ids,
-                point2d_idxs=point2d_idxs
-            )
-    return points3d
+        mm = _mmap_file(fid)
+
+    buf = np.frombuffer(mm, dtype=np.uint8)
+    offsets, lengths = _scan_points3d(buf)
+    num_points = len(offsets)
+
+    # Decode all headers in one gather: (N, 43) byte rows reinterpreted
+    # through the packed header dtype
+    headers = buf[offsets[:, None] + np.arange(43)].view(_POINT3D_HEADER_DTYPE)[:, 0]
+    ids = headers["id"].copy()
+    xyzs = np.stack([headers["x"], headers["y"], headers["z"]], axis=1).astype(np.float32)
+    rgbs = np.stack([headers["r"], headers["g"], headers["b"]], axis=1)
+    errors = headers["error"].copy()
+
+    indptr = np.zeros(num_points + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+    total = int(indptr[-1])
+
+    if lazy_tracks:
+        return Point3DTable(ids, xyzs, rgbs, errors, indptr,
+                            track_buffer=mm, track_offsets=offsets + 43 + 8)
+
+    # CSR expansion of the per-record track runs into one flat gather
+    track_starts = offsets + 43 + 8
+    elem = np.arange(total, dtype=np.int64) - np.repeat(indptr[:-1], lengths)
+    byte_base = np.repeat(track_starts, lengths) + elem * _TRACK_DTYPE.itemsize
+    track = buf[byte_base[:, None] + np.arange(8)].view(_TRACK_DTYPE)[:, 0]
+    image_ids = track["image_id"].copy()
+    point2d_idxs = track["point2d_idx"].copy()
+
+    return Point3DTable(ids, xyzs, rgbs, errors, indptr, image_ids, point2d_idxs)
+
+
+# COLMAP -> Blender axis swap, hoisted so callers don't rebuild it
+_COLMAP_TO_BLENDER = np.array([
+    [1, 0, 0],
+    [0, 0, -1],
+    [0, 1, 0],
+])
+
 
+def quat_to_rotation_matrix(qvec: np.ndarray, normalize: bool = True) -> np.ndarray:
+    """Convert quaternion to rotation matrix.
 
-def quat_to_rotation_matrix(qvec: np.ndarray) -> np.ndarray:
-    """Convert quaternion to rotation matrix"""
-    qvec = qvec / np.linalg.norm(qvec)
+    COLMAP already stores unit quaternions, so callers on trusted data
+    can pass normalize=False to skip the redundant norm/divide.
+    """
+    qvec = np.asarray(qvec, dtype=np.float64)
+    if normalize:
+        qvec = qvec / np.linalg.norm(qvec)
     w, x, y, z = qvec
     
     R = np.array([
@@ -152,6 +440,59 @@ def quat_to_rotation_matrix(qvec: np.ndarray) -> np.ndarray:
     return R
 
 
+def batch_quat_to_rotation_matrix(qvecs: np.ndarray, normalize: bool = False) -> np.ndarray:
+    """Convert (N, 4) quaternions (w, x, y, z) to (N, 3, 3) rotation matrices.
+
+    Same formulae as quat_to_rotation_matrix, applied elementwise across
+    the batch instead of building N small arrays in Python. Defaults to
+    normalize=False since COLMAP writes unit quaternions.
+    """
+    q = np.asarray(qvecs, dtype=np.float64)
+    if normalize:
+        q = q / np.linalg.norm(q, axis=1, keepdims=True)
+    w, x, y, z = q.T
+
+    R = np.empty((len(q), 3, 3))
+    R[:, 0, 0] = 1 - 2*y*y - 2*z*z
+    R[:, 0, 1] = 2*x*y - 2*z*w
+    R[:, 0, 2] = 2*x*z + 2*y*w
+    R[:, 1, 0] = 2*x*y + 2*z*w
+    R[:, 1, 1] = 1 - 2*x*x - 2*z*z
+    R[:, 1, 2] = 2*y*z - 2*x*w
+    R[:, 2, 0] = 2*x*z - 2*y*w
+    R[:, 2, 1] = 2*y*z + 2*x*w
+    R[:, 2, 2] = 1 - 2*x*x - 2*y*y
+    return R
+
+
+def batch_colmap_to_blender_transform(qvecs: np.ndarray,
+                                      tvecs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized colmap_to_blender_transform over (N, 4) qvecs / (N, 3) tvecs.
+
+    Returns (N, 3, 3) rotations and (N, 3) translations in Blender
+    coordinates; the inversion and axis swap run as a handful of batched
+    numpy ops instead of per-image small-matrix arithmetic.
+    """
+    if NUMBA_AVAILABLE:
+        q = np.ascontiguousarray(qvecs)
+        t = np.ascontiguousarray(tvecs, dtype=q.dtype)
+        R_blender = np.empty((len(q), 3, 3), dtype=q.dtype)
+        t_blender = np.empty_like(t)
+        _poses_to_blender_kernel(q, t, R_blender, t_blender)
+        return R_blender, t_blender
+
+    R = batch_quat_to_rotation_matrix(qvecs)
+    colmap_to_blender = _COLMAP_TO_BLENDER
+
+    R_c2w = R.transpose(0, 2, 1)
+    t_c2w = -np.einsum("nij,nj->ni", R_c2w, tvecs)
+
+    R_blender = np.einsum("ij,njk->nik", colmap_to_blender, R_c2w)
+    t_blender = t_c2w @ colmap_to_blender.T
+
+    return R_blender, t_blender
+
+
 def colmap_to_blender_transform(qvec: np.ndarray, tvec: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """Convert COLMAP camera pose (world-to-camera) to Blender camera pose (camera-to-world).
 
@@ -162,14 +503,7 @@ def colmap_to_blender_transform(qvec: np.ndarray, tvec: np.ndarray) -> Tuple[np.
     to Blender (x right, y forward, z up): (x, y, z) -> (x, -z, y)
     """
     R = quat_to_rotation_matrix(qvec)
-
-    colmap_to_blender = np.array(
-        [
-            [1, 0, 0],
-            [0, 0, -1],
-            [0, 1, 0],
-        ]
-    )
+    colmap_to_blender = _COLMAP_TO_BLENDER
 
     R_c2w = R.T
     t_c2w = -R_c2w @ tvec
@@ -188,9 +522,108 @@ class COLMAPLoader:
         self.cameras = {}
         self.images = {}
         self.points3d = {}
+        self._pose_cache: Dict[str, List[Tuple[str, np.ndarray, np.ndarray]]] = {}
+        self._pose_array_cache: Dict[str, Tuple[List[str], np.ndarray, np.ndarray]] = {}
+        self._point_centroid: Optional[np.ndarray] = None
+        self._resolved_path = None
         
-    def load_reconstruction(self):
+    def _cache_key(self, base_path: Path) -> np.ndarray:
+        """Stat-based cache key over the three .bin files (mtime_ns, size)"""
+        stats = [os.stat(base_path / name)
+                 for name in ("cameras.bin", "images.bin", "points3D.bin")]
+        return np.array([[s.st_mtime_ns, s.st_size] for s in stats], dtype=np.int64)
+
+    def _load_cached_reconstruction(self, base_path: Path) -> bool:
+        """Populate the loader from the .npz cache; False if stale/absent"""
+        cache_path = base_path / ".blender_cache.npz"
+        if not cache_path.exists():
+            return False
+        try:
+            with np.load(cache_path, allow_pickle=False) as cached:
+                if not np.array_equal(cached["__key__"], self._cache_key(base_path)):
+                    return False
+                params_data = cached["camera_params_data"]
+                params_indptr = cached["camera_params_indptr"]
+                cameras = {}
+                for i, camera_id in enumerate(cached["camera_ids"]):
+                    camera_id = int(camera_id)
+                    cameras[camera_id] = Camera(
+                        id=camera_id,
+                        model=str(cached["camera_models"][i]),
+                        width=int(cached["camera_widths"][i]),
+                        height=int(cached["camera_heights"][i]),
+                        params=params_data[params_indptr[i]:params_indptr[i + 1]],
+                    )
+                images = ImageTable(
+                    cached["image_ids"], cached["image_qvecs"], cached["image_tvecs"],
+                    cached["image_camera_ids"],
+                    [str(name) for name in cached["image_names"]],
+                    cached["image_point3d_indptr"], cached["image_point3d_data"],
+                )
+                points3d = Point3DTable(
+                    cached["point_ids"], cached["point_xyzs"], cached["point_rgbs"],
+                    cached["point_errors"], cached["track_indptr"],
+                    cached["track_image_ids"], cached["track_point2d_idxs"],
+                )
+        except Exception as e:
+            print(f"Ignoring unreadable COLMAP cache {cache_path}: {e}")
+            return False
+
+        self.cameras = cameras
+        self.images = images
+        self.points3d = points3d
+        print(f"Loaded COLMAP reconstruction from cache "
+              f"({len(images)} images, {len(points3d)} 3D points)")
+        return True
+
+    def _save_reconstruction_cache(self, base_path: Path) -> None:
+        """Write the parsed columnar tables back out as an .npz sidecar"""
+        if not (self.cameras and isinstance(self.images, ImageTable)
+                and isinstance(self.points3d, Point3DTable)):
+            return
+        if self.points3d.track_image_ids is None:
+            return  # lazy tracks stay in the mapped file; nothing to persist
+
+        cameras = list(self.cameras.values())
+        params_indptr = np.zeros(len(cameras) + 1, dtype=np.int64)
+        np.cumsum([len(cam.params) for cam in cameras], out=params_indptr[1:])
+        params_data = (np.concatenate([cam.params for cam in cameras])
+                       if cameras else np.empty(0, dtype=np.float32))
+
+        cache_path = base_path / ".blender_cache.npz"
+        try:
+            np.savez_compressed(
+                cache_path,
+                __key__=self._cache_key(base_path),
+                camera_ids=np.array([cam.id for cam in cameras], dtype=np.int32),
+                camera_models=np.array([cam.model for cam in cameras]),
+                camera_widths=np.array([cam.width for cam in cameras], dtype=np.int64),
+                camera_heights=np.array([cam.height for cam in cameras], dtype=np.int64),
+                camera_params_data=params_data,
+                camera_params_indptr=params_indptr,
+                image_ids=self.images.ids,
+                image_qvecs=self.images.qvecs,
+                image_tvecs=self.images.tvecs,
+                image_camera_ids=self.images.camera_ids,
+                image_names=np.array(self.images.names),
+                image_point3d_indptr=self.images.point3d_indptr,
+                image_point3d_data=self.images.point3d_data,
+                point_ids=self.points3d.ids,
+                point_xyzs=self.points3d.xyzs,
+                point_rgbs=self.points3d.rgbs,
+                point_errors=self.points3d.errors,
+                track_indptr=self.points3d.track_indptr,
+                track_image_ids=self.points3d.track_image_ids,
+                track_point2d_idxs=self.points3d.track_point2d_idxs,
+            )
+        except OSError as e:
+            print(f"Could not write COLMAP cache {cache_path}: {e}")
+
+    def load_reconstruction(self, use_cache: bool = True):
         """Load COLMAP reconstruction data"""
+        self._pose_cache.clear()
+        self._pose_array_cache.clear()
+        self._point_centroid = None
         # Try multiple possible locations for COLMAP files
         possible_paths = [
             self.colmap_path / "sparse" / "0",  # Standard location
@@ -201,43 +634,101 @@ class COLMAPLoader:
         cameras_path = None
         images_path = None
         points3d_path = None
-        
-        # Find the correct paths
+
+        # One readdir per candidate instead of three stat calls; remember
+        # the resolved directory so reloads skip discovery
+        required = {"cameras.bin", "images.bin", "points3D.bin"}
+        if self._resolved_path is not None:
+            possible_paths = [self._resolved_path] + possible_paths
         for base_path in possible_paths:
-            test_cameras = base_path / "cameras.bin"
-            test_images = base_path / "images.bin"
-            test_points3d = base_path / "points3D.bin"
-            
-            if test_cameras.exists() and test_images.exists() and test_points3d.exists():
-                cameras_path = test_cameras
-                images_path = test_images
-                points3d_path = test_points3d
+            try:
+                names = {entry.name for entry in os.scandir(base_path)}
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if required <= names:
+                cameras_path = base_path / "cameras.bin"
+                images_path = base_path / "images.bin"
+                points3d_path = base_path / "points3D.bin"
+                self._resolved_path = base_path
                 print(f"Found COLMAP files in: {base_path}")
                 break
-        
+
         if not cameras_path:
             print("Warning: Could not find complete COLMAP reconstruction files")
             return
+
+        # Second and later runs skip .bin parsing entirely when the
+        # sidecar cache matches the current files
+        if use_cache and self._load_cached_reconstruction(self._resolved_path):
+            return
+
+        # Load the three independent files concurrently; the parsers
+        # release the GIL in mmap/numpy reads, so threads overlap both
+        # the I/O wait and the C-level decode
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            cameras_future = executor.submit(read_cameras_binary, str(cameras_path))
+            images_future = executor.submit(read_images_binary, str(images_path))
+            points3d_future = executor.submit(read_points3d_binary, str(points3d_path))
+
+            try:
+                self.cameras = cameras_future.result()
+                print(f"Loaded {len(self.cameras)} cameras")
+            except Exception as e:
+                print(f"Error loading cameras: {e}")
+
+            try:
+                self.images = images_future.result()
+                print(f"Loaded {len(self.images)} images")
+            except Exception as e:
+                print(f"Error loading images: {e}")
+
+            try:
+                self.points3d = points3d_future.result()
+                print(f"Loaded {len(self.points3d)} 3D points")
+            except Exception as e:
+                print(f"Error loading 3D points: {e}")
+
+        if use_cache:
+            self._save_reconstruction_cache(self._resolved_path)
             
-        # Load the files
-        try:
-            self.cameras = read_cameras_binary(str(cameras_path))
-            print(f"Loaded {len(self.cameras)} cameras")
-        except Exception as e:
-            print(f"Error loading cameras: {e}")
-            
-        try:
-            self.images = read_images_binary(str(images_path))
-            print(f"Loaded {len(self.images)} images")
-        except Exception as e:
-            print(f"Error loading images: {e}")
-            
-        try:
-            self.points3d = read_points3d_binary(str(points3d_path))
-            print(f"Loaded {len(self.points3d)} 3D points")
-        except Exception as e:
-            print(f"Error loading 3D points: {e}")
-            
+    def get_camera_pose_arrays(self, sort: str = "id") -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Get Blender camera poses as SoA arrays: (names, (N,3,3) R, (N,3) t).
+
+        Batch consumers (keyframe upload, analytics) should prefer this
+        over get_camera_poses_for_blender: the rotations and translations
+        stay in the two contiguous arrays the batched transform produced,
+        with no per-pose slicing or restacking.
+        """
+        if not self.images:
+            return [], np.empty((0, 3, 3)), np.empty((0, 3))
+
+        cached = self._pose_array_cache.get(sort)
+        if cached is not None:
+            return cached
+
+        if isinstance(self.images, ImageTable):
+            # Columnar path: sort row indices, slice columns, no restacking
+            table = self.images
+            if sort == "name":
+                order = sorted(range(len(table)), key=table.names.__getitem__)
+            else:
+                order = np.argsort(table.ids, kind="stable")
+            names = [table.names[row] for row in order]
+            qvecs, tvecs = table.qvecs[order], table.tvecs[order]
+        else:
+            if sort == "name":
+                images: Iterable[Image] = sorted(self.images.values(), key=lambda im: im.name)
+            else:
+                images = sorted(self.images.values(), key=lambda im: im.id)
+            names = [image.name for image in images]
+            qvecs = np.stack([image.qvec for image in images])
+            tvecs = np.stack([image.tvec for image in images])
+
+        R_blender, t_blender = batch_colmap_to_blender_transform(qvecs, tvecs)
+        arrays = (names, R_blender, t_blender)
+        self._pose_array_cache[sort] = arrays
+        return arrays
+
     def get_camera_poses_for_blender(self, sort: str = "id") -> List[Tuple[str, np.ndarray, np.ndarray]]:
         """Get camera poses converted to Blender coordinate system.
 
@@ -246,35 +737,48 @@ class COLMAPLoader:
         if not self.images:
             return []
 
-        if sort == "name":
-            images: Iterable[Image] = sorted(self.images.values(), key=lambda im: im.name)
-        else:
-            images = sorted(self.images.values(), key=lambda im: im.id)
+        # Memoize per sort key; repeat queries are free until reload
+        cached = self._pose_cache.get(sort)
+        if cached is not None:
+            return cached
 
-        poses: List[Tuple[str, np.ndarray, np.ndarray]] = []
-        for image in images:
-            R_blender, t_blender = colmap_to_blender_transform(image.qvec, image.tvec)
-            poses.append((image.name, R_blender, t_blender))
+        names, R_blender, t_blender = self.get_camera_pose_arrays(sort)
+        poses = [(names[i], R_blender[i], t_blender[i]) for i in range(len(names))]
+        self._pose_cache[sort] = poses
         return poses
         
     def get_point_cloud(self) -> Tuple[np.ndarray, np.ndarray]:
         """Get 3D point cloud in Blender coordinates"""
         if not self.points3d:
             return np.array([]), np.array([])
-            
-        points = []
-        colors = []
-        
+
         # Convert to Blender coordinate system
         colmap_to_blender = np.array([
             [1, 0, 0],
             [0, 0, -1],
             [0, 1, 0]
-        ])
-        
-        for point3d in self.points3d.values():
-            point_blender = colmap_to_blender @ point3d.xyz
-            points.append(point_blender)
-            colors.append(point3d.rgb / 255.0)  # Normalize to [0, 1]
+        ], dtype=np.float32)
+
+        if isinstance(self.points3d, Point3DTable):
+            xyzs = self.points3d.xyzs.astype(np.float32, copy=False)
+            rgbs = self.points3d.rgbs
+        else:
+            xyzs = np.stack([p.xyz for p in self.points3d.values()]).astype(np.float32)
+            rgbs = np.stack([p.rgb for p in self.points3d.values()])
+
+        # One (N, 3) gemm and one scaled cast instead of per-point matmuls;
+        # float32 halves bandwidth and is what Blender ingests anyway
+        points = xyzs @ colmap_to_blender.T
+        colors = rgbs.astype(np.float32) * np.float32(1.0 / 255.0)
+        # Centroid accumulated while the points are still hot in cache,
+        # so alignment does not rescan the cloud later
+        self._point_centroid = points.mean(axis=0, dtype=np.float64)
+        return points, colors
 
-        return np.array(points), np.array(colors)
+    def get_point_cloud_centroid(self) -> np.ndarray:
+        """Centroid of the Blender-space point cloud (float64, cached)"""
+        if self._point_centroid is None:
+            points, _ = self.get_point_cloud()
+            if len(points) == 0:
+                return np.zeros(3, dtype=np.float64)
+        return self._point_centroid
@@ -6,39 +6,210 @@ except Exception:
     bpy = None  # type: ignore
     BLENDER_AVAILABLE = False
 
+import functools
+import json
 import numpy as np
 from pathlib import Path
 from typing import Optional, Tuple, List
 import struct
 
+# PLY scalar type -> numpy dtype code (endian prefix added at parse time)
+_PLY_TYPE_MAP = {
+    'float': 'f4', 'float32': 'f4',
+    'double': 'f8', 'float64': 'f8',
+    'uchar': 'u1', 'uint8': 'u1',
+    'char': 'i1', 'int8': 'i1',
+    'ushort': 'u2', 'uint16': 'u2',
+    'short': 'i2', 'int16': 'i2',
+    'uint': 'u4', 'uint32': 'u4',
+    'int': 'i4', 'int32': 'i4',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _vertex_dtype(prefix: str, properties_key: tuple) -> np.dtype:
+    """Structured dtype for a PLY vertex layout, memoized per schema.
+
+    Splatfacto exports all share one fixed property list, so every load
+    after the first reuses the same specialized dtype object instead of
+    rebuilding the field descriptors from the header.
+    """
+    return np.dtype([(prop_name, prefix + _PLY_TYPE_MAP.get(prop_type, 'f4'))
+                     for prop_type, prop_name in properties_key])
+
+
+def _sigmoid_kernel(sh, out):
+    for i in range(sh.shape[0]):
+        for c in range(3):
+            out[i, c] = 1.0 / (1.0 + np.exp(-sh[i, c]))
+
+
+def _axis_swap_centroid_kernel(pts, out):
+    sx = sy = sz = 0.0
+    for i in range(pts.shape[0]):
+        x, y, z = pts[i, 0], pts[i, 1], pts[i, 2]
+        out[i, 0] = x
+        out[i, 1] = -z
+        out[i, 2] = y
+        sx += x
+        sy += -z
+        sz += y
+    return sx, sy, sz
+
+
+def _fps_kernel(pts, idx, min_dist):
+    current = idx[0]
+    for j in range(1, idx.shape[0]):
+        best = 0
+        best_dist = np.float32(-1.0)
+        for i in range(pts.shape[0]):
+            dx = pts[i, 0] - pts[current, 0]
+            dy = pts[i, 1] - pts[current, 1]
+            dz = pts[i, 2] - pts[current, 2]
+            d = dx * dx + dy * dy + dz * dz
+            if d < min_dist[i]:
+                min_dist[i] = d
+            if min_dist[i] > best_dist:
+                best_dist = min_dist[i]
+                best = i
+        idx[j] = best
+        current = best
+
+
+try:
+    import numba
+
+    def _sigmoid_kernel_parallel(sh, out):
+        for i in numba.prange(sh.shape[0]):
+            for c in range(3):
+                out[i, c] = 1.0 / (1.0 + np.exp(-sh[i, c]))
+
+    _sigmoid_kernel = numba.njit(parallel=True, fastmath=True, cache=True)(
+        _sigmoid_kernel_parallel)
+    _fps_kernel = numba.njit(cache=True)(_fps_kernel)
+    _axis_swap_centroid_kernel = numba.njit(cache=True)(_axis_swap_centroid_kernel)
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def farthest_point_subsample(points: np.ndarray, count: int) -> np.ndarray:
+    """Pick `count` indices spread over the cloud via farthest-point sampling.
+
+    Keeps alignment cost bounded regardless of reconstruction size: ICP
+    on a few thousand well-spread anchors matches full-cloud alignment
+    while the distance work stays O(count * N) with an O(N) footprint.
+    """
+    pts = np.ascontiguousarray(points, dtype=np.float32)
+    if len(pts) <= count:
+        return np.arange(len(pts))
+
+    idx = np.empty(count, dtype=np.int64)
+    idx[0] = 0
+    min_dist = np.full(len(pts), np.inf, dtype=np.float32)
+    if NUMBA_AVAILABLE:
+        _fps_kernel(pts, idx, min_dist)
+    else:
+        current = 0
+        for j in range(1, count):
+            d = ((pts - pts[current]) ** 2).sum(axis=1)
+            np.minimum(min_dist, d, out=min_dist)
+            current = int(np.argmax(min_dist))
+            idx[j] = current
+    return idx
+
+
+def colmap_axis_swap_with_centroid(points: np.ndarray):
+    """Apply the COLMAP->Blender axis swap and return (transformed, centroid).
+
+    Fuses the centroid accumulation into the transform pass so the cloud
+    is streamed through memory once instead of transform + np.mean twice.
+    Sums are kept in float64 to avoid drift on multi-million-point clouds.
+    """
+    pts = np.ascontiguousarray(points, dtype=np.float32)
+    out = np.empty_like(pts)
+    if len(pts) == 0:
+        return out, np.zeros(3, dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        sx, sy, sz = _axis_swap_centroid_kernel(pts, out)
+        centroid = np.array([sx, sy, sz], dtype=np.float64) / len(pts)
+    else:
+        out[:, 0] = pts[:, 0]
+        out[:, 1] = -pts[:, 2]
+        out[:, 2] = pts[:, 1]
+        centroid = out.mean(axis=0, dtype=np.float64)
+    return out, centroid
+
+
+def _load_splat_cache(cache_path: Path, source_stat, sh_to_rgb: str):
+    """Return cached (positions, colors, properties) or None if stale/absent"""
+    if not cache_path.exists():
+        return None
+    try:
+        with np.load(cache_path, allow_pickle=False) as cached:
+            meta = cached['__source_stat__']
+            if meta[0] != source_stat.st_mtime_ns or meta[1] != source_stat.st_size:
+                return None
+            if str(cached['__sh_to_rgb__']) != sh_to_rgb:
+                return None
+            positions = cached['positions']
+            colors = cached['colors']
+            properties = {k: cached[k] for k in cached.files
+                          if k not in ('positions', 'colors', '__source_stat__', '__sh_to_rgb__')}
+            return positions, colors, properties
+    except Exception as e:
+        print(f"Ignoring unreadable splat cache {cache_path}: {e}")
+        return None
+
 
-def load_ply_gaussian_splats(ply_path: str) -> Tuple[np.ndarray, np.ndarray, dict]:
+def load_ply_gaussian_splats(ply_path: str, sh_to_rgb: str = 'sigmoid',
+                             use_cache: bool = True) -> Tuple[np.ndarray, np.ndarray, dict]:
     """Load 3D Gaussian Splats from PLY file
-    
+
+    Args:
+        ply_path: Path to the PLY file
+        sh_to_rgb: 'sigmoid' (default) or 'linear' for the canonical
+            clamp(sh * C0 + 0.5) 3DGS convention
+        use_cache: read/write a `<ply>.cache.npz` sidecar so repeat loads
+            skip parsing and SH conversion entirely
+
     Returns:
         positions: (N, 3) array of 3D positions
         colors: (N, 3) array of RGB colors [0, 1]
         properties: dict of additional properties (opacity, scale, rotation, etc.)
     """
-    positions = []
-    colors = []
+    source_stat = Path(ply_path).stat()
+    cache_path = Path(str(ply_path) + '.cache.npz')
+    if use_cache:
+        cached = _load_splat_cache(cache_path, source_stat, sh_to_rgb)
+        if cached is not None:
+            positions, colors, properties = cached
+            print(f"Loaded {len(positions)} Gaussian splats from cache")
+            return positions, colors, properties
+
     properties = {}
-    
+
     with open(ply_path, 'rb') as f:
-        # Read PLY header
-        line = f.readline().decode('ascii').strip()
-        if line != 'ply':
+        # Read the header in one gulp and locate the terminator with a
+        # single memchr-backed find instead of one readline/decode/strip
+        # round trip per header line (3DGS headers run 50+ properties)
+        probe = f.read(65536)
+        if not probe.startswith(b'ply'):
             raise ValueError("Invalid PLY file")
-        
+        terminator = probe.find(b'end_header')
+        if terminator < 0:
+            raise ValueError("PLY header terminator not found")
+        header_end = probe.index(b'\n', terminator) + 1
+        f.seek(header_end)
+
         vertex_count = 0
         properties_list = []
-        in_header = True
         format_binary = False
         is_little_endian = True
-        
-        while in_header:
-            line = f.readline().decode('ascii').strip()
-            
+
+        for line in probe[:terminator].decode('ascii').splitlines():
+            line = line.strip()
             if line.startswith('format'):
                 fmt = line.split()[1]
                 if 'binary' in fmt:
@@ -51,133 +222,121 @@ def load_ply_gaussian_splats(ply_path: str) -> Tuple[np.ndarray, np.ndarray, dic
                 prop_type = parts[1]
                 prop_name = parts[2]
                 properties_list.append((prop_type, prop_name))
-            elif line == 'end_header':
-                in_header = False
         
         print(f"Loading {vertex_count} vertices in {'binary' if format_binary else 'ASCII'} format")
         print(f"Properties: {[name for _, name in properties_list]}")
         
-        # Initialize properties dict
-        for _, prop_name in properties_list:
-            if prop_name not in ['x', 'y', 'z']:
-                properties[prop_name] = []
-        
-        # Map PLY types to struct formats
-        def read_value(ply_type: str):
-            if ply_type in ('float', 'float32'):
-                return struct.unpack(('<' if is_little_endian else '>') + 'f', f.read(4))[0]
-            if ply_type in ('double', 'float64'):
-                return struct.unpack(('<' if is_little_endian else '>') + 'd', f.read(8))[0]
-            if ply_type in ('uchar', 'uint8'):
-                return struct.unpack('B', f.read(1))[0]
-            if ply_type in ('char', 'int8'):
-                return struct.unpack('b', f.read(1))[0]
-            if ply_type in ('ushort', 'uint16'):
-                return struct.unpack(('<' if is_little_endian else '>') + 'H', f.read(2))[0]
-            if ply_type in ('short', 'int16'):
-                return struct.unpack(('<' if is_little_endian else '>') + 'h', f.read(2))[0]
-            if ply_type in ('uint', 'uint32'):
-                return struct.unpack(('<' if is_little_endian else '>') + 'I', f.read(4))[0]
-            if ply_type in ('int', 'int32'):
-                return struct.unpack(('<' if is_little_endian else '>') + 'i', f.read(4))[0]
-            # Default to float
-            return struct.unpack(('<' if is_little_endian else '>') + 'f', f.read(4))[0]
-
-        # Read vertex data
-        for i in range(vertex_count):
-            if format_binary:
-                data: List[float] = []
-                for prop_type, _prop_name in properties_list:
-                    data.append(read_value(prop_type))
-            else:
-                # ASCII format
-                line = f.readline().decode('ascii').strip()
-                tokens = line.split()
-                data = []
-                for (prop_type, _prop_name), tok in zip(properties_list, tokens):
-                    if prop_type in ('uchar', 'uint8', 'char', 'int8', 'ushort', 'uint16', 'short', 'int16', 'uint', 'uint32', 'int', 'int32'):
-                        data.append(float(int(tok)))
-                    else:
-                        data.append(float(tok))
-            
-            # Extract position (x, y, z)
-            pos = data[:3]
-            positions.append(pos)
-            
-            # Process properties by name
-            prop_idx = 0
+        if format_binary:
+            # Map the vertex block through a structured dtype instead of
+            # reading it: the page cache serves columns on demand and
+            # column access stays zero-copy until a caller materializes it
+            prefix = '<' if is_little_endian else '>'
+            vertex_dtype = _vertex_dtype(prefix, tuple(properties_list))
+            vertex_data = np.memmap(ply_path, dtype=vertex_dtype, mode='r',
+                                    offset=header_end, shape=(vertex_count,))
+
+            positions = np.stack([vertex_data['x'], vertex_data['y'], vertex_data['z']],
+                                 axis=1).astype(np.float32)
+            for _prop_type, prop_name in properties_list:
+                if prop_name not in ('x', 'y', 'z'):
+                    properties[prop_name] = vertex_data[prop_name]
+        else:
+            # ASCII format: let numpy's C tokenizer chew through the block
+            # instead of splitting and casting each line in Python
+            ascii_data = np.loadtxt(f, dtype=np.float32, max_rows=vertex_count)
+            ascii_data = np.atleast_2d(ascii_data)
+
+            column_of = {prop_name: i for i, (_, prop_name) in enumerate(properties_list)}
+            positions = ascii_data[:, [column_of['x'], column_of['y'], column_of['z']]]
             for prop_type, prop_name in properties_list:
-                if prop_name in ['x', 'y', 'z']:
-                    prop_idx += 1
+                if prop_name in ('x', 'y', 'z'):
                     continue
-                    
-                if prop_name not in properties:
-                    properties[prop_name] = []
-                    
-                properties[prop_name].append(data[prop_idx])
-                prop_idx += 1
+                column = ascii_data[:, column_of[prop_name]]
+                np_type = _PLY_TYPE_MAP.get(prop_type, 'f4')
+                if not np_type.startswith('f'):
+                    column = column.astype(np_type)
+                properties[prop_name] = column
         
+        # Some pipelines (SuperSplat, KSPLAT exports) store plain uchar
+        # colors; use them directly and skip the SH conversion entirely
+        if all(k in properties for k in ('red', 'green', 'blue')):
+            print("Using embedded red/green/blue vertex colors")
+            colors = (np.stack([
+                np.asarray(properties['red']),
+                np.asarray(properties['green']),
+                np.asarray(properties['blue']),
+            ], axis=1).astype(np.float32) / 255.0).astype(np.float16)
         # Convert spherical harmonics to RGB colors for Nerfstudio format
-        if 'f_dc_0' in properties and 'f_dc_1' in properties and 'f_dc_2' in properties:
+        elif 'f_dc_0' in properties and 'f_dc_1' in properties and 'f_dc_2' in properties:
             print("Converting spherical harmonics coefficients to RGB colors...")
             # f_dc coefficients are the 0th order SH coefficients
-            # Improved SH to RGB conversion for better visibility
-            
-            for i in range(len(positions)):
-                # Extract DC components (0th order spherical harmonics)
-                sh_r = properties['f_dc_0'][i] 
-                sh_g = properties['f_dc_1'][i]
-                sh_b = properties['f_dc_2'][i]
-                
-                # Enhanced SH to RGB conversion with better color mapping
-                # Using sigmoid activation for better color range
-                import math
-                def sigmoid(x):
-                    return 1.0 / (1.0 + math.exp(-x))
-                
-                # Apply sigmoid to get better color distribution
-                rgb_r = sigmoid(sh_r)
-                rgb_g = sigmoid(sh_g) 
-                rgb_b = sigmoid(sh_b)
-                
-                # Alternative: Linear mapping with offset
-                # rgb_r = max(0, min(1, sh_r * 0.5 + 0.5))
-                # rgb_g = max(0, min(1, sh_g * 0.5 + 0.5))
-                # rgb_b = max(0, min(1, sh_b * 0.5 + 0.5))
-                
-                colors.append([rgb_r, rgb_g, rgb_b])
+            sh = np.stack([
+                np.asarray(properties['f_dc_0']),
+                np.asarray(properties['f_dc_1']),
+                np.asarray(properties['f_dc_2']),
+            ], axis=1).astype(np.float32)
+
+            if sh_to_rgb == 'linear':
+                # Canonical 3DGS convention: 0th-order SH basis constant
+                colors = np.clip(sh * 0.28209479177387814 + 0.5, 0.0, 1.0)
+            elif NUMBA_AVAILABLE:
+                # Parallel jitted sigmoid; threads help once the cloud
+                # stops fitting in cache
+                colors = np.empty_like(sh)
+                _sigmoid_kernel(sh, colors)
+            else:
+                # Sigmoid activation for better color distribution
+                colors = 1.0 / (1.0 + np.exp(-sh))
+            # [0,1] colors survive float16 with no visible loss; halves
+            # the memory traffic of subsample copies and attribute writes
+            colors = colors.astype(np.float16)
         else:
             # Fallback to default colors if no SH coefficients found
             print("No spherical harmonics found, using default gray colors")
-            colors = [[0.5, 0.5, 0.5] for _ in range(len(positions))]
-    
-    # Convert lists to numpy arrays
-    positions = np.array(positions)
-    colors = np.array(colors)
+            colors = np.full((len(positions), 3), 0.5, dtype=np.float32)
     
-    # Convert relevant properties to numpy arrays
+    # Both parse paths already produce arrays; asarray avoids redundant
+    # copies (np.array would duplicate every column for large files)
+    positions = np.asarray(positions)
+    colors = np.asarray(colors)
+
     for key in ['opacity', 'scale_0', 'scale_1', 'scale_2', 'rot_0', 'rot_1', 'rot_2', 'rot_3']:
         if key in properties:
-            properties[key] = np.array(properties[key])
+            properties[key] = np.asarray(properties[key])
+    if 'opacity' in properties:
+        properties['opacity'] = properties['opacity'].astype(np.float16)
     
-    # Group scale and rotation if they exist
+    # Group scale and rotation if they exist; np.stack writes each
+    # grouped array in one pass instead of column_stack's per-column
+    # reshape-and-concatenate promotion
     if all(k in properties for k in ['scale_0', 'scale_1', 'scale_2']):
-        properties['scale'] = np.column_stack([
-            properties['scale_0'], 
-            properties['scale_1'], 
+        properties['scale'] = np.stack([
+            properties['scale_0'],
+            properties['scale_1'],
             properties['scale_2']
-        ])
-    
+        ], axis=1)
+
     if all(k in properties for k in ['rot_0', 'rot_1', 'rot_2', 'rot_3']):
-        properties['rotation'] = np.column_stack([
+        properties['rotation'] = np.stack([
             properties['rot_0'],
-            properties['rot_1'], 
+            properties['rot_1'],
             properties['rot_2'],
             properties['rot_3']
-        ])
+        ], axis=1)
     
     print(f"Loaded {len(positions)} Gaussian splats with {len(colors)} colors")
-    
+
+    if use_cache:
+        try:
+            np.savez(cache_path,
+                     __source_stat__=np.array([source_stat.st_mtime_ns, source_stat.st_size],
+                                              dtype=np.int64),
+                     __sh_to_rgb__=np.array(sh_to_rgb),
+                     positions=positions, colors=colors,
+                     **{k: v for k, v in properties.items() if isinstance(v, np.ndarray)})
+        except OSError as e:
+            print(f"Could not write splat cache {cache_path}: {e}")
+
     return positions, colors, properties
 
 
@@ -218,12 +377,48 @@ def import_gaussian_splats_with_kiri(ply_path: str) -> Optional[bpy.types.Object
         return None
 
 
+def _create_native_pointcloud(positions: np.ndarray, colors: np.ndarray,
+                              name: str, point_radius: float):
+    """Create a native PointCloud object, or None if this build lacks one.
+
+    Available from Blender 3.1; per-point radius and color live in
+    attribute buffers filled with foreach_set, so there is no per-splat
+    instance to evaluate.
+    """
+    if not hasattr(bpy.data, 'pointclouds'):
+        return None
+    try:
+        pc = bpy.data.pointclouds.new(name)
+        pc.points.add(len(positions))
+        pc.points.foreach_set(
+            'co', np.ascontiguousarray(positions, dtype=np.float32).ravel())
+
+        radius_attr = pc.attributes.new('radius', 'FLOAT', 'POINT')
+        radius_attr.data.foreach_set(
+            'value', np.full(len(positions), point_radius, dtype=np.float32))
+
+        if len(colors) == len(positions):
+            rgba = np.empty((len(colors), 4), dtype=np.float32)
+            rgba[:, :3] = colors
+            rgba[:, 3] = 1.0
+            color_attr = pc.attributes.new('color', 'FLOAT_COLOR', 'POINT')
+            color_attr.data.foreach_set('color', rgba.ravel())
+
+        obj = bpy.data.objects.new(name, pc)
+        bpy.context.collection.objects.link(obj)
+        return obj
+    except Exception as e:
+        print(f"Native point cloud unavailable, falling back to instancing: {e}")
+        return None
+
+
 def create_gaussian_splat_points(positions: np.ndarray,
                                 colors: np.ndarray,
                                 properties: dict = None,
                                 name: str = "GaussianSplats",
                                 point_radius: float = 0.01,
-                                max_points: int = 200000) -> bpy.types.Object:
+                                max_points: int = 200000,
+                                debug: bool = False) -> bpy.types.Object:
     """Create an instanced representation of Gaussian splats using Geometry Nodes.
 
     Note: This is a visualization fallback and not true 3DGS rendering.
@@ -240,7 +435,10 @@ def create_gaussian_splat_points(positions: np.ndarray,
     # Subsample for performance
     if len(positions) > max_points:
         print(f"   📊 Subsampling from {len(positions)} to {max_points} points for performance")
-        indices = np.random.choice(len(positions), max_points, replace=False)
+        # shuffle=False enables Floyd's O(k) sampler; np.random.choice
+        # would permute all N indices just to keep the first k
+        rng = np.random.default_rng()
+        indices = rng.choice(len(positions), size=max_points, replace=False, shuffle=False)
         positions = positions[indices]
         colors = colors[indices] if len(colors) == len(indices) else colors
         if properties:
@@ -248,63 +446,76 @@ def create_gaussian_splat_points(positions: np.ndarray,
                 if isinstance(values, np.ndarray) and len(values) == len(indices):
                     properties[key] = values[indices]
 
-    # Base mesh with vertices only
-    mesh = bpy.data.meshes.new(name)
-    mesh.from_pydata([tuple(p) for p in positions], [], [])
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-
-    # Instance object
-    sphere_mesh = bpy.data.meshes.new(f"{name}_InstanceMesh")
-    import bmesh as _bmesh
-    bm = _bmesh.new()
-    _bmesh.ops.create_icosphere(bm, subdivisions=1, radius=point_radius)
-    bm.to_mesh(sphere_mesh)
-    bm.free()
-    sphere_obj = bpy.data.objects.new(f"{name}_Instance", sphere_mesh)
-    bpy.context.collection.objects.link(sphere_obj)
-    sphere_obj.hide_render = True
-    sphere_obj.hide_viewport = True
-
-    # Geometry Nodes for instancing
-    try:
-        mod = obj.modifiers.new(name="SplatInstancer", type='NODES')
-        nt = bpy.data.node_groups.new(f"GN_{name}", 'GeometryNodeTree')
-        mod.node_group = nt
-        nodes = nt.nodes
-        links = nt.links
-        nodes.clear()
-
-        n_input = nodes.new('NodeGroupInput')
-        n_output = nodes.new('NodeGroupOutput')
-        nt.inputs.new('NodeSocketGeometry', 'Geometry')
-        nt.outputs.new('NodeSocketGeometry', 'Geometry')
-
-        n_mesh_to_points = nodes.new('GeometryNodeMeshToPoints')
-        n_mesh_to_points.inputs['Radius'].default_value = point_radius
-
-        n_obj_info = nodes.new('GeometryNodeObjectInfo')
-        n_obj_info.inputs['As Instance'].default_value = True
-        n_obj_info.inputs['Object'].default_value = sphere_obj
-
-        n_instance = nodes.new('GeometryNodeInstanceOnPoints')
-
-        # Link
-        links.new(n_input.outputs['Geometry'], n_mesh_to_points.inputs['Mesh'])
-        links.new(n_mesh_to_points.outputs['Points'], n_instance.inputs['Points'])
-        links.new(n_obj_info.outputs['Geometry'], n_instance.inputs['Instance'])
-        links.new(n_instance.outputs['Instances'], n_output.inputs['Geometry'])
-    except Exception as e:
-        print(f"Failed to create Geometry Nodes for splats: {e}")
+    # Prefer the native PointCloud datatype (Blender 3.1+): one attribute
+    # buffer drawn as screen-space discs, no per-point instance evaluation
+    obj = _create_native_pointcloud(positions, colors, name, point_radius)
+
+    if obj is None:
+        # Fallback: vertex-only mesh instanced through Geometry Nodes.
+        # foreach_set copies straight from the numpy buffer instead of
+        # building a Python tuple per vertex
+        mesh = bpy.data.meshes.new(name)
+        mesh.vertices.add(len(positions))
+        mesh.vertices.foreach_set(
+            'co', np.ascontiguousarray(positions, dtype=np.float32).ravel())
+        mesh.update()
+        obj = bpy.data.objects.new(name, mesh)
+        bpy.context.collection.objects.link(obj)
+
+        # Instance object
+        sphere_mesh = bpy.data.meshes.new(f"{name}_InstanceMesh")
+        import bmesh as _bmesh
+        bm = _bmesh.new()
+        _bmesh.ops.create_icosphere(bm, subdivisions=1, radius=point_radius)
+        bm.to_mesh(sphere_mesh)
+        bm.free()
+        sphere_obj = bpy.data.objects.new(f"{name}_Instance", sphere_mesh)
+        bpy.context.collection.objects.link(sphere_obj)
+        sphere_obj.hide_render = True
+        sphere_obj.hide_viewport = True
+
+        # Geometry Nodes for instancing
+        try:
+            mod = obj.modifiers.new(name="SplatInstancer", type='NODES')
+            nt = bpy.data.node_groups.new(f"GN_{name}", 'GeometryNodeTree')
+            mod.node_group = nt
+            nodes = nt.nodes
+            links = nt.links
+            nodes.clear()
+
+            n_input = nodes.new('NodeGroupInput')
+            n_output = nodes.new('NodeGroupOutput')
+            nt.inputs.new('NodeSocketGeometry', 'Geometry')
+            nt.outputs.new('NodeSocketGeometry', 'Geometry')
+
+            n_mesh_to_points = nodes.new('GeometryNodeMeshToPoints')
+            n_mesh_to_points.inputs['Radius'].default_value = point_radius
+
+            n_obj_info = nodes.new('GeometryNodeObjectInfo')
+            n_obj_info.inputs['As Instance'].default_value = True
+            n_obj_info.inputs['Object'].default_value = sphere_obj
+
+            n_instance = nodes.new('GeometryNodeInstanceOnPoints')
+
+            # Link
+            links.new(n_input.outputs['Geometry'], n_mesh_to_points.inputs['Mesh'])
+            links.new(n_mesh_to_points.outputs['Points'], n_instance.inputs['Points'])
+            links.new(n_obj_info.outputs['Geometry'], n_instance.inputs['Instance'])
+            links.new(n_instance.outputs['Instances'], n_output.inputs['Geometry'])
+        except Exception as e:
+            print(f"Failed to create Geometry Nodes for splats: {e}")
 
     # Material (optional for emission look)
     create_splat_material(obj, name)
 
-    # Custom props for debug/inspection
-    if properties:
-        for prop_name, prop_values in properties.items():
-            if isinstance(prop_values, np.ndarray):
-                obj[f"splat_{prop_name}"] = prop_values[:10].tolist()  # sample preview
+    # Custom props for debug/inspection: one JSON blob instead of one RNA
+    # write per property (3DGS files can carry 50+ SH coefficient columns)
+    if debug and properties:
+        obj["splat_preview"] = json.dumps({
+            prop_name: np.asarray(prop_values[:10], dtype=np.float64).tolist()
+            for prop_name, prop_values in properties.items()
+            if isinstance(prop_values, np.ndarray)
+        })
 
     print(f"   ✅ 3DGS point cloud '{name}' created (instanced)")
     return obj
@@ -478,7 +689,8 @@ def align_gaussian_splats_with_colmap(splat_obj: bpy.types.Object,
     ])
     
     # Transform splat positions to match COLMAP coordinate system
-    splat_positions_transformed = (colmap_to_blender @ splat_positions.T).T
+    # (right-multiply by the transpose: no transposes of the big array)
+    splat_positions_transformed = splat_positions @ colmap_to_blender.T
     
     # Calculate centroids
     colmap_centroid = np.mean(colmap_positions, axis=0)
@@ -498,16 +710,16 @@ def align_gaussian_splats_with_colmap(splat_obj: bpy.types.Object,
     print(f"📦 COLMAP bbox: [{colmap_bbox[0]:.2f}, {colmap_bbox[1]:.2f}, {colmap_bbox[2]:.2f}]")
     print(f"📦 Splat bbox: [{splat_bbox[0]:.2f}, {splat_bbox[1]:.2f}, {splat_bbox[2]:.2f}]")
     
-    # Use median of bbox ratios for more stable scaling
-    scale_ratios = []
-    for i in range(3):
-        if splat_bbox[i] > 0:
-            scale_ratios.append(colmap_bbox[i] / splat_bbox[i])
-    
-    if scale_ratios:
-        scale_factor = np.median(scale_ratios)
+    # Use median of bbox ratios for more stable scaling; degenerate axes
+    # (zero extent) are masked out instead of special-cased in a loop
+    scale_ratios = np.where(splat_bbox > 0,
+                            colmap_bbox / np.where(splat_bbox > 0, splat_bbox, 1.0),
+                            np.nan)
+
+    if np.isfinite(scale_ratios).any():
+        scale_factor = float(np.nanmedian(scale_ratios))
         print(f"📏 Raw scale factor: {scale_factor:.3f}")
-        
+
         # Apply conservative scale limits
         scale_factor = max(0.5, min(2.0, scale_factor))
         print(f"📏 Clamped scale factor: {scale_factor:.3f}")
@@ -550,43 +762,60 @@ def simple_icp_alignment(source_points: np.ndarray,
     """
     # Subsample points for faster computation
     max_points = 1000
+    rng = np.random.default_rng()
     if len(source_points) > max_points:
-        indices = np.random.choice(len(source_points), max_points, replace=False)
+        indices = rng.choice(len(source_points), size=max_points, replace=False, shuffle=False)
         source_subset = source_points[indices]
     else:
         source_subset = source_points.copy()
-    
+
     if len(target_points) > max_points:
-        indices = np.random.choice(len(target_points), max_points, replace=False)
+        indices = rng.choice(len(target_points), size=max_points, replace=False, shuffle=False)
         target_subset = target_points[indices]
     else:
         target_subset = target_points.copy()
-    
+
     # Initialize transformation
     R = np.eye(3)
-    t = np.zeros(3)
-    
+    t = target_subset.mean(axis=0) - source_subset.mean(axis=0)
+
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        # Without a nearest-neighbour index we can only match centroids,
+        # and that converges in one step since R never changes
+        print("scipy not available, falling back to centroid alignment")
+        return R, t
+
+    # Point-to-point ICP: nearest neighbours via KDTree, best-fit
+    # rotation via SVD of the matched covariance (Kabsch) per iteration
+    tree = cKDTree(target_subset)
     prev_error = float('inf')
-    
+
     for iteration in range(max_iterations):
-        # Transform source points
-        transformed_source = (R @ source_subset.T).T + t
-        
-        # Find closest points (simplified - just use centroid matching)
-        source_centroid = np.mean(transformed_source, axis=0)
-        target_centroid = np.mean(target_subset, axis=0)
-        
-        # Update translation
-        t = target_centroid - source_centroid
-        
-        # Calculate current error
-        current_error = np.linalg.norm(t)
-        
+        transformed_source = source_subset @ R.T + t
+
+        distances, nearest = tree.query(transformed_source)
+        matched_target = target_subset[nearest]
+
+        current_error = float(distances.mean())
         if abs(prev_error - current_error) < tolerance:
             break
-            
         prev_error = current_error
-    
+
+        source_centroid = transformed_source.mean(axis=0)
+        target_centroid = matched_target.mean(axis=0)
+        H = (transformed_source - source_centroid).T @ (matched_target - target_centroid)
+        U, _, Vt = np.linalg.svd(H)
+        R_step = Vt.T @ U.T
+        if np.linalg.det(R_step) < 0:
+            # Reflection: flip the smallest singular direction
+            Vt[2] *= -1
+            R_step = Vt.T @ U.T
+
+        R = R_step @ R
+        t = R_step @ (t - source_centroid) + target_centroid
+
     return R, t
 
 
@@ -6,7 +6,6 @@ Example usage script for COLMAP and 3D Gaussian Splatting integration in Blender
 
 import bpy
 from pathlib import Path
-from main import main
 
 def run_example():
     """실제 데이터 경로로 예제 실행"""
@@ -69,7 +68,10 @@ def run_example():
     
     print("✅ All required files found!")
     
-    # 통합 실행
+    # 통합 실행 - 무거운 파이프라인 모듈은 실제 실행 시점에만 임포트
+    # (quick_test만 쓸 때 COLMAP/3DGS 스택 로딩 비용을 내지 않도록)
+    from main import main
+
     try:
         success = main(
             colmap_path=str(colmap_path),
@@ -95,14 +97,77 @@ def run_example():
         return False
 
 
+def _add_test_mesh(name, verts, faces, location):
+    """bpy.data로 메시 오브젝트를 직접 생성 (연산자 오버헤드 없음)"""
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.update()
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    obj.location = location
+    return obj
+
+
+def _cube_geometry(size=1.0):
+    s = size
+    verts = [(-s, -s, -s), (-s, -s, s), (-s, s, -s), (-s, s, s),
+             (s, -s, -s), (s, -s, s), (s, s, -s), (s, s, s)]
+    faces = [(0, 2, 3, 1), (4, 5, 7, 6), (0, 1, 5, 4),
+             (2, 6, 7, 3), (0, 4, 6, 2), (1, 3, 7, 5)]
+    return verts, faces
+
+
+def _sphere_geometry(radius=1.0, segments=16, rings=8):
+    import numpy as np
+    verts = [(0.0, 0.0, radius)]
+    for r in range(1, rings):
+        phi = np.pi * r / rings
+        theta = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+        ring = np.stack([radius * np.sin(phi) * np.cos(theta),
+                         radius * np.sin(phi) * np.sin(theta),
+                         np.full(segments, radius * np.cos(phi))], axis=1)
+        verts.extend(map(tuple, ring))
+    verts.append((0.0, 0.0, -radius))
+
+    faces = []
+    bottom = len(verts) - 1
+    for s in range(segments):
+        faces.append((0, 1 + s, 1 + (s + 1) % segments))
+    for r in range(rings - 2):
+        a = 1 + r * segments
+        b = a + segments
+        for s in range(segments):
+            s2 = (s + 1) % segments
+            faces.append((a + s, b + s, b + s2, a + s2))
+    last = 1 + (rings - 2) * segments
+    for s in range(segments):
+        faces.append((bottom, last + (s + 1) % segments, last + s))
+    return verts, faces
+
+
+def _cylinder_geometry(radius=1.0, depth=2.0, segments=32):
+    import numpy as np
+    theta = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    x, y = radius * np.cos(theta), radius * np.sin(theta)
+    half = depth / 2
+    verts = ([(float(xi), float(yi), -half) for xi, yi in zip(x, y)]
+             + [(float(xi), float(yi), half) for xi, yi in zip(x, y)])
+    faces = [tuple(range(segments - 1, -1, -1)),
+             tuple(range(segments, 2 * segments))]
+    for s in range(segments):
+        s2 = (s + 1) % segments
+        faces.append((s, s2, segments + s2, segments + s))
+    return verts, faces
+
+
 def quick_test():
     """빠른 테스트를 위한 함수 (더미 데이터 사용)"""
     print("=== Quick Test Mode ===")
     print("이 모드는 실제 데이터 없이 Blender 씬만 설정합니다.")
     
-    # Blender 씬 클리어
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    # Blender 씬 클리어 (연산자 오버헤드 없이 datablock 직접 제거)
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
     
     # 테스트용 카메라 생성
     bpy.ops.object.camera_add(location=(0, -5, 2))
@@ -113,20 +178,35 @@ def quick_test():
     bpy.context.scene.frame_start = 1
     bpy.context.scene.frame_end = 50
     
-    for frame in range(1, 51):
-        bpy.context.scene.frame_set(frame)
-        # 원형 궤도로 카메라 이동
-        import math
-        angle = (frame - 1) * 2 * math.pi / 50
-        camera.location = (5 * math.sin(angle), 5 * math.cos(angle), 2)
-        camera.rotation_euler = (math.radians(60), 0, angle + math.radians(90))
-        camera.keyframe_insert(data_path="location", frame=frame)
-        camera.keyframe_insert(data_path="rotation_euler", frame=frame)
-    
-    # 테스트용 오브젝트들 추가
-    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 0))
-    bpy.ops.mesh.primitive_uv_sphere_add(location=(2, 0, 1))
-    bpy.ops.mesh.primitive_cylinder_add(location=(-2, 0, 0.5))
+    # 원형 궤도 키프레임을 numpy로 미리 계산하고 fcurve에 벌크 업로드
+    # (keyframe_insert를 프레임×채널만큼 호출하는 대신 API 호출 6번)
+    import numpy as np
+    frames = np.arange(1, 51, dtype=np.float32)
+    angles = (frames - 1) * (2 * np.pi / 50)
+    locations = np.stack([5 * np.sin(angles), 5 * np.cos(angles),
+                          np.full_like(angles, 2.0)], axis=1)
+    rotations = np.stack([np.full_like(angles, np.radians(60)),
+                          np.zeros_like(angles),
+                          angles + np.radians(90)], axis=1)
+
+    camera.animation_data_create()
+    action = bpy.data.actions.new("Test_Camera_Anim")
+    camera.animation_data.action = action
+    for data_path, values in (("location", locations), ("rotation_euler", rotations)):
+        for axis in range(3):
+            fc = action.fcurves.new(data_path=data_path, index=axis)
+            fc.keyframe_points.add(len(frames))
+            co = np.empty(len(frames) * 2, dtype=np.float32)
+            co[0::2] = frames
+            co[1::2] = values[:, axis]
+            fc.keyframe_points.foreach_set("co", co)
+            fc.update()
+    
+    # 테스트용 오브젝트들 추가 - bpy.ops 연산자는 호출마다 context/undo/
+    # depsgraph 오버헤드를 내므로 bpy.data로 메시를 직접 생성
+    _add_test_mesh("Test_Cube", *_cube_geometry(), location=(0, 0, 0))
+    _add_test_mesh("Test_Sphere", *_sphere_geometry(), location=(2, 0, 1))
+    _add_test_mesh("Test_Cylinder", *_cylinder_geometry(), location=(-2, 0, 0.5))
     
     # 카메라를 활성 카메라로 설정
     bpy.context.scene.camera = camera
@@ -14,6 +14,8 @@ import argparse
 import sys
 from pathlib import Path
 
+import numpy as np
+
 try:
     import bpy
     BLENDER_AVAILABLE = True
@@ -22,11 +24,45 @@ except ImportError:
     BLENDER_AVAILABLE = False
 
 from blender_colmap_3dgs.colmap_parser import COLMAPLoader
-from blender_colmap_3dgs.blender_animation import BlenderCOLMAPIntegration
-from blender_colmap_3dgs.gaussian_splatting import GaussianSplattingIntegration
+from blender_colmap_3dgs.blender_animation import BlenderCOLMAPIntegration, set_view3d
+from blender_colmap_3dgs.gaussian_splatting import (
+    GaussianSplattingIntegration,
+    farthest_point_subsample,
+)
+
+
+def _splats_already_aligned(ply_path: Path, splat_positions, colmap_points,
+                            sample: int = 1000) -> bool:
+    """Detect splats exported in COLMAP coordinates (e.g. splatfacto).
 
+    A splatfacto PLY from the same run is already registered to the
+    reconstruction, so alignment would be a full-cloud no-op pass. Check
+    the filename hint, then compare bounding-box centers of a cheap
+    first-`sample` slice of both clouds; if the offset is small relative
+    to the COLMAP bbox diagonal, treat the splats as pre-aligned.
+    """
+    if 'splatfacto' not in ply_path.name.lower():
+        return False
+    if splat_positions is None or len(splat_positions) == 0:
+        return False
 
-def main(colmap_path: str, ply_path: str, images_path: str = None, use_kiri: bool = True):
+    sp = np.asarray(splat_positions[:sample], dtype=np.float32)
+    # The splat slice is still in COLMAP coordinates, while colmap_points
+    # come out of get_point_cloud() already swapped into the Blender
+    # frame; compare both centers in the Blender frame.
+    sp = sp[:, [0, 2, 1]] * np.array([1, -1, 1], dtype=np.float32)
+    cp = np.asarray(colmap_points[:sample], dtype=np.float32)
+    sp_center = (sp.min(axis=0) + sp.max(axis=0)) * 0.5
+    cp_min, cp_max = cp.min(axis=0), cp.max(axis=0)
+    cp_center = (cp_min + cp_max) * 0.5
+    bbox_diag = float(np.linalg.norm(cp_max - cp_min))
+    if bbox_diag <= 0:
+        return False
+    return float(np.linalg.norm(cp_center - sp_center)) < 0.1 * bbox_diag
+
+
+def main(colmap_path: str, ply_path: str, images_path: str = None, use_kiri: bool = True,
+         align: bool = True):
     """Main integration function"""
     
     if not BLENDER_AVAILABLE:
@@ -72,6 +108,8 @@ def main(colmap_path: str, ply_path: str, images_path: str = None, use_kiri: boo
         
         # Get camera poses and point cloud
         camera_poses = colmap_loader.get_camera_poses_for_blender(sort='id')
+        # SoA 형태의 포즈 배열 (키프레임 벌크 업로드용, 리스트 재적층 생략)
+        _, pose_rotations, pose_locations = colmap_loader.get_camera_pose_arrays(sort='id')
         colmap_points, colmap_colors = colmap_loader.get_point_cloud()
         
         # Get camera parameters for the first camera
@@ -113,10 +151,18 @@ def main(colmap_path: str, ply_path: str, images_path: str = None, use_kiri: boo
         if gs_integration.load_gaussian_splats(str(ply_path), use_kiri=use_kiri):
             print("   - Successfully loaded Gaussian splats")
             
-            # Align splats with COLMAP point cloud
-            if len(colmap_points) > 0:
-                print("   - Aligning splats with COLMAP point cloud...")
-                gs_integration.align_with_colmap(colmap_points)
+            # Align splats with COLMAP point cloud; a few thousand
+            # farthest-point anchors align as well as the full cloud
+            if not align:
+                print("   - Alignment disabled (--no-align)")
+            elif len(colmap_points) > 0:
+                if _splats_already_aligned(ply_path, gs_integration.splat_positions,
+                                           colmap_points):
+                    print("   - Splats already in COLMAP coordinates, skipping alignment")
+                else:
+                    print("   - Aligning splats with COLMAP point cloud...")
+                    anchor_idx = farthest_point_subsample(colmap_points, 5000)
+                    gs_integration.align_with_colmap(colmap_points[anchor_idx])
         else:
             print("   - Failed to load Gaussian splats")
         
@@ -130,7 +176,9 @@ def main(colmap_path: str, ply_path: str, images_path: str = None, use_kiri: boo
             colors=colmap_colors,
             images_path=str(images_path) if images_path else "",
             camera_params=camera_params,
-            clear_existing=True
+            clear_existing=True,
+            pose_rotations=pose_rotations,
+            pose_locations=pose_locations
         )
         
         # Setup Gaussian splat visualization
@@ -151,14 +199,8 @@ def main(colmap_path: str, ply_path: str, images_path: str = None, use_kiri: boo
             bpy.context.scene.frame_end = len(camera_poses)
             bpy.context.scene.frame_current = 1
         
-        # Set viewport to camera view
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        space.region_3d.view_perspective = 'CAMERA'
-                        break
-                break
+        # Set viewport to camera view (cached VIEW_3D lookup)
+        set_view3d(perspective='CAMERA')
         
         print("\n=== Integration Complete! ===")
         print("Scene is ready for visualization:")
@@ -199,6 +241,7 @@ def _parse_blender_cli_args(argv):
     parser.add_argument('--ply-path', required=True, help='Path to Gaussian splats PLY file')
     parser.add_argument('--images-path', default=None, help='Path to original images folder (optional)')
     parser.add_argument('--no-kiri', action='store_true', help='Disable KIRI 3DGS Engine integration')
+    parser.add_argument('--no-align', action='store_true', help='Skip splat/COLMAP alignment (splats already registered)')
     return parser.parse_args(argv) if argv else None
 
 
@@ -221,6 +264,7 @@ def run_blender_script():
             ply_path=args.ply_path,
             images_path=args.images_path,
             use_kiri=not args.no_kiri,
+            align=not args.no_align,
         )
 
     # Fallback: show example guidance when no args provided
@@ -249,7 +293,9 @@ if __name__ == "__main__":
                           help='Path to original images folder')
         parser.add_argument('--no-kiri', action='store_true',
                           help='Disable KIRI 3DGS Engine integration')
-        
+        parser.add_argument('--no-align', action='store_true',
+                          help='Skip splat/COLMAP alignment (splats already registered)')
+
         args = parser.parse_args()
         
         print("Note: To run this integration, execute this script within Blender:")
@@ -13,6 +13,30 @@ project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
 from main import main
+from blender_colmap_3dgs.blender_animation import set_view3d
+
+def _tune_material(mat, emission_strength=5.0, roughness=0.1, metallic=0.2):
+    """노드 이름으로 직접 조회해 머티리얼 조정 (노드 전체 순회 제거).
+
+    nodes.get()은 내부 이름 해시 조회라 노드 수와 무관하게 O(1) -
+    머티리얼마다 전체 노드 트리를 파이썬 루프로 도는 비용을 없앤다.
+    """
+    if not mat or not mat.use_nodes or not mat.node_tree:
+        return False
+
+    tree = mat.node_tree
+    tuned = False
+    emission = tree.nodes.get("Emission")
+    if emission:
+        emission.inputs['Strength'].default_value = emission_strength
+        tuned = True
+    bsdf = tree.nodes.get("Principled BSDF")
+    if bsdf:
+        bsdf.inputs['Roughness'].default_value = roughness
+        bsdf.inputs['Metallic'].default_value = metallic
+        tuned = True
+    return tuned
+
 
 def quick_fix_visualization():
     """3DGS 시각화 문제를 빠르게 수정"""
@@ -46,32 +70,16 @@ def quick_fix_visualization():
                     # 객체를 더 잘 보이게 만들기
                     obj.display_type = 'SOLID'
                     
-                    # 머티리얼 수정
-                    if obj.data.materials:
-                        mat = obj.data.materials[0]
-                        if mat and mat.use_nodes:
-                            # 더 밝게 만들기
-                            for node in mat.node_tree.nodes:
-                                if node.type == 'EMISSION':
-                                    node.inputs['Strength'].default_value = 5.0  # 더 밝게
-                                elif node.type == 'BSDF_PRINCIPLED':
-                                    node.inputs['Roughness'].default_value = 0.1
-                                    node.inputs['Metallic'].default_value = 0.2
-                            
-                            print(f"   ✨ Enhanced material for {obj.name}")
+                    # 머티리얼 수정 - 노드 이름으로 직접 조회 (전체 순회 없음)
+                    if obj.data.materials and _tune_material(obj.data.materials[0]):
+                        print(f"   ✨ Enhanced material for {obj.name}")
             
-            # 2. 뷰포트 설정 수정
-            for area in bpy.context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    for space in area.spaces:
-                        if space.type == 'VIEW_3D':
-                            # Rendered 모드로 변경
-                            space.shading.type = 'RENDERED'
-                            space.shading.use_scene_world = True
-                            space.shading.use_scene_lights = True
-                            print("   🎭 Set viewport to Rendered mode")
-                            break
-                    break
+            # 2. 뷰포트 설정 수정 (캐시된 VIEW_3D 공간 헬퍼 사용)
+            space = set_view3d(shading='RENDERED')
+            if space is not None:
+                space.shading.use_scene_world = True
+                space.shading.use_scene_lights = True
+                print("   🎭 Set viewport to Rendered mode")
             
             # 3. 렌더 엔진 설정 (Blender 버전 호환)
             try:
@@ -90,12 +98,14 @@ def quick_fix_visualization():
                     bpy.context.scene.render.engine = 'CYCLES'
                     print("   💫 Fallback to Cycles")
             
-            # 4. 조명 추가
-            # 밝은 sun light 추가
-            bpy.ops.object.light_add(type='SUN', location=(10, 10, 20))
-            sun = bpy.context.active_object
-            sun.data.energy = 10.0
-            sun.data.color = (1.0, 1.0, 1.0)
+            # 4. 조명 추가 - bpy.ops 대신 데이터 API 직접 생성
+            # (연산자의 context/undo/depsgraph 오버헤드 생략)
+            light_data = bpy.data.lights.new(name="QuickFixSun", type='SUN')
+            light_data.energy = 10.0
+            light_data.color = (1.0, 1.0, 1.0)
+            sun = bpy.data.objects.new("QuickFixSun", light_data)
+            sun.location = (10, 10, 20)
+            bpy.context.collection.objects.link(sun)
             print("   ☀️ Added bright sun light")
             
             # 5. 카메라 위치 조정 (첫 번째 프레임으로 이동 후 약간 뒤로)
@@ -12,63 +12,108 @@ project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
 from blender_colmap_3dgs.colmap_parser import COLMAPLoader
-from blender_colmap_3dgs.gaussian_splatting import load_ply_gaussian_splats
-from blender_colmap_3dgs.blender_animation import BlenderCOLMAPIntegration
+from blender_colmap_3dgs.gaussian_splatting import (
+    colmap_axis_swap_with_centroid,
+    load_ply_gaussian_splats,
+)
+from blender_colmap_3dgs.blender_animation import BlenderCOLMAPIntegration, clear_scene, set_view3d
+
+def _get_pointcloud_material():
+    """포인트 클라우드 공용 머티리얼 - 한 번만 만들어 모든 객체가 공유.
+
+    객체마다 노드 트리를 새로 만들면 EEVEE가 머티리얼 수만큼 셰이더를
+    컴파일하므로, Color 속성을 읽는 에미시브 머티리얼 하나를 재사용한다.
+    """
+    mat = bpy.data.materials.get("PC_Emission")
+    if mat is not None:
+        return mat
+
+    mat = bpy.data.materials.new(name="PC_Emission")
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    nodes.clear()
+
+    output = nodes.new('ShaderNodeOutputMaterial')
+    emission = nodes.new('ShaderNodeEmission')
+    emission.inputs['Strength'].default_value = 3.0
+    attr = nodes.new('ShaderNodeAttribute')
+    attr.attribute_name = 'Color'
+    links.new(attr.outputs['Color'], emission.inputs['Color'])
+    links.new(emission.outputs['Emission'], output.inputs['Surface'])
+    return mat
+
+
+def _quantized_rgba(colors):
+    """[0,1] float 색상을 8비트로 양자화한 평탄 RGBA 버퍼 생성.
+
+    프리뷰(에미시브) 용도라 8비트 정밀도면 충분하고, BYTE_COLOR 속성은
+    포인트당 4바이트로 FLOAT_COLOR(16바이트) 대비 VRAM/업로드 대역폭이
+    1/4이다. 정밀도가 필요하면 속성 타입만 FLOAT_COLOR로 되돌리면 된다.
+    """
+    colors_u8 = np.clip(np.asarray(colors, dtype=np.float32) * 255.0 + 0.5,
+                        0, 255).astype(np.uint8)
+    rgba = np.empty((len(colors_u8), 4), dtype=np.float32)
+    rgba[:, :3] = colors_u8 * np.float32(1.0 / 255.0)
+    rgba[:, 3] = 1.0
+    return rgba.reshape(-1)
+
 
 def create_simple_point_cloud(positions, colors, name="SimplePointCloud"):
     """간단한 포인트 클라우드 생성 (성능 최적화)"""
     
     print(f"🔨 Creating simple point cloud with {len(positions)} points...")
     
-    # 큰 데이터는 서브샘플링
+    # 큰 데이터는 서브샘플링 - 시각화 용도라 균일 stride로 충분
+    # (np.random.choice는 N 크기 순열을 만들어 수백만 점에서 느림)
     if len(positions) > 100000:
         print(f"   📊 Subsampling to 100k points for better performance...")
-        indices = np.random.choice(len(positions), 100000, replace=False)
-        positions = positions[indices]
-        colors = colors[indices] if len(colors) > 0 else colors
-    
-    # 간단한 vertex mesh 생성
-    mesh = bpy.data.meshes.new(name)
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    
-    # 단순 정점만 생성 (면 없음)
-    mesh.from_pydata(positions.tolist(), [], [])
-    mesh.update()
+        step = max(1, len(positions) // 100000)
+        positions = np.ascontiguousarray(positions[::step][:100000])
+        colors = np.ascontiguousarray(colors[::step][:100000]) if len(colors) > 0 else colors
     
-    # 정점 색상 적용
-    if len(colors) > 0:
-        mesh.vertex_colors.new(name='Color')
-        color_layer = mesh.vertex_colors['Color']
-        
-        # 정점 색상 설정 (간단한 방식)
-        for i, color in enumerate(colors):
-            if i < len(mesh.vertices):
-                # Vertex colors are applied per face-loop, but we need per-vertex
-                # For point clouds, we create dummy faces
-                pass
-    
-    # 간단한 에미시브 머티리얼
-    mat = bpy.data.materials.new(name=f"{name}_Material")
-    mat.use_nodes = True
-    obj.data.materials.append(mat)
-    
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
-    
-    # 단순 에미시브 셰이더
-    output = nodes.new('ShaderNodeOutputMaterial')
-    emission = nodes.new('ShaderNodeEmission')
-    emission.inputs['Strength'].default_value = 3.0
-    emission.inputs['Color'].default_value = (1.0, 0.5, 0.2, 1.0)  # 주황색으로 잘 보이게
+    positions = np.ascontiguousarray(positions, dtype=np.float32)
+
+    # Blender 3.1+ 네이티브 PointCloud 우선 사용 - 쓰지도 않는
+    # face/loop/edge 레이어 없이 SoA 버퍼만 GPU로 올라감
+    obj = None
+    if hasattr(bpy.data, 'pointclouds'):
+        try:
+            pc = bpy.data.pointclouds.new(name)
+            pc.points.add(len(positions))
+            pc.points.foreach_set("co", positions.reshape(-1))
+            if len(colors) > 0:
+                color_attr = pc.attributes.new('Color', 'BYTE_COLOR', 'POINT')
+                color_attr.data.foreach_set("color_srgb", _quantized_rgba(colors))
+            obj = bpy.data.objects.new(name, pc)
+            bpy.context.collection.objects.link(obj)
+        except Exception as e:
+            print(f"   PointCloud API unavailable, using mesh vertices: {e}")
+            obj = None
+
+    if obj is None:
+        # 구버전 Blender: 간단한 vertex mesh 생성
+        mesh = bpy.data.meshes.new(name)
+        obj = bpy.data.objects.new(name, mesh)
+        bpy.context.collection.objects.link(obj)
+
+        # 단순 정점만 생성 (면 없음) - foreach_set으로 numpy 버퍼를 한 번에 복사
+        mesh.vertices.add(len(positions))
+        mesh.vertices.foreach_set("co", positions.reshape(-1))
+        mesh.update()
+
+        # 정점 색상 적용 (POINT 도메인 색상 속성에 벌크 업로드)
+        if len(colors) > 0:
+            color_attr = mesh.color_attributes.new(name='Color', type='BYTE_COLOR', domain='POINT')
+            color_attr.data.foreach_set("color_srgb", _quantized_rgba(colors))
     
-    links.new(emission.outputs['Emission'], output.inputs['Surface'])
+    # 공유 에미시브 머티리얼 (셰이더 컴파일 1회, 색은 Color 속성에서)
+    obj.data.materials.append(_get_pointcloud_material())
     
     # 포인트 클라우드 표시 설정
     obj.display_type = 'SOLID'
     
-    print(f"   ✅ Simple point cloud created: {len(mesh.vertices)} vertices")
+    print(f"   ✅ Simple point cloud created: {len(positions)} points")
     return obj
 
 def simple_main():
@@ -82,9 +127,8 @@ def simple_main():
     ply_path = "/home/hwoo-joo/github/hloc-nerfstudio/exports/splatfacto_daewoo_drone_003/daewoo_drone_003_hloc/splatfacto_daewoo_drone_003_splat.ply"
     
     try:
-        # 기존 오브젝트 삭제
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
+        # 기존 오브젝트 삭제 (연산자 대신 datablock 직접 제거)
+        clear_scene()
         
         # 1. COLMAP 데이터 로드
         print("\n1️⃣ Loading COLMAP data...")
@@ -117,19 +161,14 @@ def simple_main():
         # 5. 3DGS 포인트 클라우드 (간단히)
         print("\n5️⃣ Creating 3DGS point cloud...")
         
-        # 좌표 변환 (COLMAP과 맞추기)
-        transform_matrix = np.array([
-            [1, 0, 0],
-            [0, 0, -1],
-            [0, 1, 0]
-        ])
-        splat_positions_transformed = (transform_matrix @ splat_positions.T).T
-        
+        # 좌표 변환 (COLMAP과 맞추기) + 중심점 누적을 한 패스로 융합
+        # (변환 후 np.mean으로 배열을 다시 훑지 않도록 커널 융합)
+        splat_positions_transformed, splat_center = colmap_axis_swap_with_centroid(splat_positions)
+
         splat_obj = create_simple_point_cloud(splat_positions_transformed, splat_colors, "Gaussian_Splats")
-        
-        # 간단한 정렬 (중심점 맞추기)
-        colmap_center = np.mean(colmap_points, axis=0)
-        splat_center = np.mean(splat_positions_transformed, axis=0)
+
+        # 간단한 정렬 (중심점 맞추기) - COLMAP 중심점은 로더가 로드 시 캐시
+        colmap_center = colmap_loader.get_point_cloud_centroid()
         offset = colmap_center - splat_center
         
         splat_obj.location = tuple(offset)
@@ -147,10 +186,12 @@ def simple_main():
         if camera:
             bpy.context.scene.camera = camera
         
-        # 밝은 조명 추가
-        bpy.ops.object.light_add(type='SUN', location=(10, 10, 20))
-        sun = bpy.context.active_object
-        sun.data.energy = 5.0
+        # 밝은 조명 추가 - 연산자 대신 데이터 API 직접 생성
+        light_data = bpy.data.lights.new(name="SimpleSun", type='SUN')
+        light_data.energy = 5.0
+        sun = bpy.data.objects.new("SimpleSun", light_data)
+        sun.location = (10, 10, 20)
+        bpy.context.collection.objects.link(sun)
         
         # 렌더 설정 (Blender 버전 호환)
         try:
@@ -164,15 +205,12 @@ def simple_main():
                 bpy.context.scene.render.engine = 'CYCLES'
                 print("   ✅ Fallback to Cycles")
         
-        # 뷰포트 설정
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        space.shading.type = 'MATERIAL'
-                        space.region_3d.view_perspective = 'CAMERA'
-                        break
-                break
+        # 뷰포트 설정 (캐시된 VIEW_3D 공간 헬퍼 사용, 중첩 루프 제거)
+        set_view3d(perspective='CAMERA', shading='MATERIAL')
+
+        # 생성은 전부 bpy.data 경로라 depsgraph는 태그만 쌓임 -
+        # 단계마다 재평가하는 대신 여기서 한 번에 평가
+        bpy.context.view_layer.update()
         
         print("\n🎉 Simple setup complete!")
         print("\n📖 Controls:")
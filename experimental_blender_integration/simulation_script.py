@@ -144,14 +144,9 @@ def main():
         if blender_integration.camera:
             bpy.context.scene.camera = blender_integration.camera
             
-            # 뷰포트를 카메라 뷰로 설정
-            for area in bpy.context.screen.areas:
-                if area.type == 'VIEW_3D':
-                    for space in area.spaces:
-                        if space.type == 'VIEW_3D':
-                            space.region_3d.view_perspective = 'CAMERA'
-                            break
-                    break
+            # 뷰포트를 카메라 뷰로 설정 (spaces.active 기반 캐시 헬퍼)
+            from blender_colmap_3dgs.blender_animation import set_view3d
+            set_view3d(perspective='CAMERA')
         
         print("   ✅ 애니메이션 범위:", f"{bpy.context.scene.frame_start} - {bpy.context.scene.frame_end}")
         print("   ✅ 해상도:", f"{scene.render.resolution_x}x{scene.render.resolution_y}")
@@ -31,10 +31,10 @@ def test_full_integration():
             
         print(f"✅ COLMAP: {len(colmap_loader.cameras)} cameras, {len(colmap_loader.images)} images, {len(colmap_loader.points3d)} points")
         
-        # Step 2: Get camera poses
+        # Step 2: Get camera poses (SoA arrays - no tuple list to restack)
         print("\n2. Converting camera poses for Blender...")
-        camera_poses = colmap_loader.get_camera_poses_for_blender()
-        print(f"✅ Converted {len(camera_poses)} camera poses")
+        pose_names, pose_rotations, pose_locations = colmap_loader.get_camera_pose_arrays()
+        print(f"✅ Converted {len(pose_names)} camera poses")
         
         # Step 3: Get point cloud
         print("\n3. Extracting COLMAP point cloud...")
@@ -82,22 +82,18 @@ def test_full_integration():
         
         # Step 7: Animation analysis
         print("\n7. Analyzing camera animation...")
-        if len(camera_poses) > 1:
-            # Calculate camera path length
-            path_length = 0
-            prev_pos = camera_poses[0][2]
-            for _, _, pos in camera_poses[1:]:
-                path_length += np.linalg.norm(pos - prev_pos)
-                prev_pos = pos
-            
+        if len(pose_names) > 1:
+            # Path length and velocity in one vectorized pass - the SoA
+            # translation array is already (N,3) contiguous, no rebuild
+            step_lengths = np.linalg.norm(np.diff(pose_locations, axis=0), axis=1)
+            path_length = float(step_lengths.sum())
+
             print(f"Camera path length: {path_length:.2f} units")
-            print(f"Animation frames: {len(camera_poses)}")
+            print(f"Animation frames: {len(pose_names)}")
             print(f"Recommended frame rate: 24-30 fps")
-            
+
             # Check for smooth motion
-            positions = np.array([pos for _, _, pos in camera_poses])
-            velocities = np.diff(positions, axis=0)
-            avg_velocity = np.mean(np.linalg.norm(velocities, axis=1))
+            avg_velocity = float(step_lengths.mean())
             print(f"Average camera velocity: {avg_velocity:.3f} units/frame")
         
         print("\n✅ Full integration test completed successfully!")
@@ -66,17 +66,19 @@ def test_header_reading():
     print(f"\n=== PLY Header Analysis ===")
     
     try:
+        # Single find() for the terminator instead of a readline loop
         with open(ply_path, 'rb') as f:
-            lines = []
-            while True:
-                line = f.readline().decode('ascii').strip()
-                lines.append(line)
-                print(f"Header: {line}")
-                if line == 'end_header':
-                    break
-                if len(lines) > 50:  # Safety limit
-                    break
-        
+            probe = f.read(65536)
+
+        terminator = probe.find(b'end_header')
+        if terminator < 0:
+            print("❌ PLY header terminator not found")
+            return False
+
+        header_end = probe.index(b'\n', terminator) + 1
+        for line in probe[:header_end].decode('ascii').splitlines():
+            print(f"Header: {line.strip()}")
+
         return True
         
     except Exception as e:
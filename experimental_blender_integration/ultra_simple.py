@@ -7,7 +7,6 @@ import bpy
 import sys
 from pathlib import Path
 import numpy as np
-import mathutils
 
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
@@ -15,6 +14,90 @@ sys.path.append(str(project_root))
 from blender_colmap_3dgs.colmap_parser import COLMAPLoader
 from blender_colmap_3dgs.gaussian_splatting import load_ply_gaussian_splats
 
+# 포인트 하나당 붙일 템플릿 지오메트리 (큐브 = COLMAP, 옥타히드론 = 3DGS)
+_CUBE_VERTS = 0.05 * np.array(
+    [[-1, -1, -1], [-1, -1, 1], [-1, 1, -1], [-1, 1, 1],
+     [1, -1, -1], [1, -1, 1], [1, 1, -1], [1, 1, 1]], dtype=np.float32)
+_CUBE_FACES = np.array(
+    [[0, 2, 3, 1], [4, 5, 7, 6], [0, 1, 5, 4],
+     [2, 6, 7, 3], [0, 4, 6, 2], [1, 3, 7, 5]], dtype=np.int32)
+_OCTA_VERTS = 0.05 * np.array(
+    [[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1], [0, 0, -1]],
+    dtype=np.float32)
+_OCTA_FACES = np.array(
+    [[0, 2, 4], [2, 1, 4], [1, 3, 4], [3, 0, 4],
+     [2, 0, 5], [1, 2, 5], [3, 1, 5], [0, 3, 5]], dtype=np.int32)
+
+
+def _emission_attr_material(name, strength):
+    """Color 속성을 읽는 에미시브 머티리얼 - 클라우드당 1개만 생성"""
+    mat = bpy.data.materials.get(name)
+    if mat is not None:
+        return mat
+
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    nodes.clear()
+
+    output = nodes.new('ShaderNodeOutputMaterial')
+    emission = nodes.new('ShaderNodeEmission')
+    emission.inputs['Strength'].default_value = strength
+    attr = nodes.new('ShaderNodeAttribute')
+    attr.attribute_name = 'Color'
+    links.new(attr.outputs['Color'], emission.inputs['Color'])
+    links.new(emission.outputs['Emission'], output.inputs['Surface'])
+    return mat
+
+
+def _tiled_point_mesh(name, points, colors, template_verts, template_faces, strength):
+    """포인트마다 오브젝트/머티리얼을 만드는 대신 템플릿을 타일링한 단일 메시 생성.
+
+    bpy.ops 프리미티브를 포인트 수만큼 호출하면 호출마다 depsgraph 갱신이
+    일어난다. 템플릿 정점을 브로드캐스트로 N개 위치에 복제한 SoA 버퍼를
+    foreach_set으로 한 번에 올려 오브젝트 1개 + 머티리얼 1개로 끝낸다.
+    """
+    n = len(points)
+    tv = len(template_verts)
+    nf, fv = template_faces.shape
+
+    verts = (np.asarray(points, dtype=np.float32)[:, None, :]
+             + template_verts[None, :, :]).reshape(-1)
+    face_idx = (template_faces[None, :, :]
+                + (np.arange(n, dtype=np.int32) * tv)[:, None, None]).reshape(-1)
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(n * tv)
+    mesh.vertices.foreach_set("co", verts)
+    mesh.loops.add(n * nf * fv)
+    mesh.loops.foreach_set("vertex_index", face_idx)
+    mesh.polygons.add(n * nf)
+    mesh.polygons.foreach_set(
+        "loop_start", np.arange(0, n * nf * fv, fv, dtype=np.int32))
+    mesh.polygons.foreach_set(
+        "loop_total", np.full(n * nf, fv, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+    if len(colors) > 0:
+        # 에미시브 프리뷰라 8비트면 충분 - BYTE_COLOR는 정점당 4바이트로
+        # FLOAT_COLOR(16바이트) 대비 VRAM/업로드 대역폭 1/4
+        colors_u8 = np.clip(np.asarray(colors, dtype=np.float32) * 255.0 + 0.5,
+                            0, 255).astype(np.uint8)
+        rgba = np.empty((n, 4), dtype=np.float32)
+        rgba[:, :3] = colors_u8 * np.float32(1.0 / 255.0)
+        rgba[:, 3] = 1.0
+        color_attr = mesh.color_attributes.new(
+            name='Color', type='BYTE_COLOR', domain='POINT')
+        color_attr.data.foreach_set(
+            "color_srgb", np.repeat(rgba, tv, axis=0).reshape(-1))
+
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    obj.data.materials.append(_emission_attr_material(f"{name}_Mat", strength))
+    return obj
+
+
 def ultra_simple_main():
     """최대한 간단한 통합"""
     
@@ -26,10 +109,10 @@ def ultra_simple_main():
     ply_path = "/home/hwoo-joo/github/hloc-nerfstudio/exports/splatfacto_daewoo_drone_003/daewoo_drone_003_hloc/splatfacto_daewoo_drone_003_splat.ply"
     
     try:
-        # 1. 씬 클리어
+        # 1. 씬 클리어 (연산자 오버헤드 없이 datablock 직접 제거)
         print("\n🧹 Clearing scene...")
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
+        for obj in list(bpy.data.objects):
+            bpy.data.objects.remove(obj, do_unlink=True)
         
         # 2. COLMAP 데이터 로드
         print("\n📁 Loading COLMAP data...")
@@ -40,100 +123,74 @@ def ultra_simple_main():
             print("❌ No COLMAP images found")
             return False
         
-        # 카메라 포즈와 포인트 클라우드
-        camera_poses = colmap_loader.get_camera_poses_for_blender()
+        # 카메라 포즈(SoA 배열)와 포인트 클라우드 - 튜플 리스트 재적층 없이
+        # (N,3,3)/(N,3) 연속 배열 그대로 키프레임 벌크 업로드에 사용
+        pose_names, pose_rotations, pose_locations = colmap_loader.get_camera_pose_arrays()
         colmap_points, colmap_colors = colmap_loader.get_point_cloud()
-        
-        print(f"   ✅ {len(camera_poses)} poses, {len(colmap_points)} points")
+
+        print(f"   ✅ {len(pose_names)} poses, {len(colmap_points)} points")
         
         # 3. 3DGS 데이터 로드
         print("\n📄 Loading 3DGS data...")
         splat_positions, splat_colors, _ = load_ply_gaussian_splats(ply_path)
         
-        # 서브샘플링 (성능을 위해)
+        # 서브샘플링 (성능을 위해) - 시각화 용도라 균일 stride로 충분
+        # (np.random.choice는 N 전체를 셔플하는 O(N) 메모리 패스)
         if len(splat_positions) > 50000:
-            indices = np.random.choice(len(splat_positions), 50000, replace=False)
-            splat_positions = splat_positions[indices]
-            splat_colors = splat_colors[indices]
+            step = max(1, len(splat_positions) // 50000)
+            splat_positions = splat_positions[::step][:50000]
+            splat_colors = splat_colors[::step][:50000]
             print(f"   📊 Subsampled to {len(splat_positions)} splats")
         
-        # 좌표 변환 (COLMAP 맞추기)
-        transform = np.array([[1, 0, 0], [0, 0, -1], [0, 1, 0]])
-        splat_positions = (transform @ splat_positions.T).T
+        # 좌표 변환 (COLMAP 맞추기) - 고정 축 교환/부호 반전이므로
+        # 행렬곱 대신 열 재배열 (서브샘플 후라 50k 행만 건드림)
+        x, y, z = splat_positions.T
+        splat_positions = np.column_stack([x, -z, y])
         
         print(f"   ✅ {len(splat_positions)} splats loaded")
         
-        # 4. 간단한 카메라 애니메이션
+        # 4. 간단한 카메라 애니메이션 - keyframe_insert를 포즈×채널만큼
+        # 호출하는 대신 SoA 배열을 fcurve에 벌크 업로드 (최대 100프레임)
         print("\n📷 Creating camera...")
-        bpy.ops.object.camera_add()
-        camera = bpy.context.active_object
+        from blender_colmap_3dgs.blender_animation import create_camera_with_animation
+
+        num_frames = min(len(pose_names), 100)
+        camera = create_camera_with_animation(
+            None,
+            rotations=pose_rotations[:num_frames],
+            locations=pose_locations[:num_frames])
         camera.name = "AnimatedCamera"
-        
-        # 애니메이션 설정
-        bpy.context.scene.frame_start = 1
-        bpy.context.scene.frame_end = min(len(camera_poses), 100)  # 최대 100프레임
-        
-        # 키프레임 추가 (간단히)
-        for i, (name, rot_matrix, translation) in enumerate(camera_poses[:100]):
-            frame = i + 1
-            bpy.context.scene.frame_set(frame)
-            
-            # 위치 설정
-            camera.location = mathutils.Vector(translation)
-            
-            # 회전 설정
-            rot_euler = mathutils.Matrix(rot_matrix).to_euler()
-            camera.rotation_euler = rot_euler
-            
-            # 키프레임 삽입
-            camera.keyframe_insert(data_path="location")
-            camera.keyframe_insert(data_path="rotation_euler")
-        
+
         bpy.context.scene.camera = camera
         print(f"   ✅ Camera with {bpy.context.scene.frame_end} keyframes")
         
         # 5. COLMAP 포인트 클라우드 (간단한 큐브들)
         print("\n🔴 Creating COLMAP visualization...")
         
-        # 서브샘플링
+        # 서브샘플링 (균일 stride)
         if len(colmap_points) > 10000:
-            indices = np.random.choice(len(colmap_points), 10000, replace=False)
-            colmap_sample = colmap_points[indices]
-            colmap_colors_sample = colmap_colors[indices]
+            step = max(1, len(colmap_points) // 10000)
+            colmap_sample = colmap_points[::step][:10000]
+            colmap_colors_sample = colmap_colors[::step][:10000]
         else:
             colmap_sample = colmap_points
             colmap_colors_sample = colmap_colors
         
-        for i, (point, color) in enumerate(zip(colmap_sample, colmap_colors_sample)):
-            if i % 1000 == 0:  # 더 적은 포인트만
-                bpy.ops.mesh.primitive_cube_add(location=point, size=0.1)
-                cube = bpy.context.active_object
-                cube.name = f"COLMAP_Point_{i}"
-                
-                # 빨간색 머티리얼
-                mat = bpy.data.materials.new(f"ColmapMat_{i}")
-                mat.use_nodes = True
-                nodes = mat.node_tree.nodes
-                nodes.clear()
-                
-                output = nodes.new('ShaderNodeOutputMaterial')
-                emission = nodes.new('ShaderNodeEmission')
-                emission.inputs['Color'].default_value = (*color, 1.0)
-                emission.inputs['Strength'].default_value = 2.0
-                
-                mat.node_tree.links.new(emission.outputs['Emission'], output.inputs['Surface'])
-                cube.data.materials.append(mat)
-        
-        print(f"   ✅ COLMAP points created (sampled)")
+        # 포인트마다 큐브 오브젝트를 만드는 대신 큐브 템플릿을 타일링한
+        # 단일 메시로 생성 (depsgraph 갱신 1회, 머티리얼 1개)
+        _tiled_point_mesh("COLMAP_Points", colmap_sample, colmap_colors_sample,
+                          _CUBE_VERTS, _CUBE_FACES, strength=2.0)
+
+        print(f"   ✅ COLMAP points created ({len(colmap_sample)} cubes, single mesh)")
         
         # 6. 3DGS 포인트 클라우드 (구체들)
         print("\n🟡 Creating 3DGS visualization...")
         
-        # 더 적은 샘플링
+        # 더 적은 샘플링 (균일 stride)
         if len(splat_positions) > 5000:
-            indices = np.random.choice(len(splat_positions), 5000, replace=False)
-            splat_sample = splat_positions[indices]
-            splat_colors_sample = splat_colors[indices]
+            step = max(1, len(splat_positions) // 5000)
+            splat_sample = splat_positions[::step][:5000]
+            splat_colors_sample = splat_colors[::step][:5000]
         else:
             splat_sample = splat_positions
             splat_colors_sample = splat_colors
@@ -144,27 +201,11 @@ def ultra_simple_main():
             splat_center = np.mean(splat_sample, axis=0)
             offset = colmap_center - splat_center
             
-            for i, (point, color) in enumerate(zip(splat_sample, splat_colors_sample)):
-                if i % 500 == 0:  # 매우 적은 포인트만
-                    adjusted_point = point + offset
-                    bpy.ops.mesh.primitive_uv_sphere_add(location=adjusted_point, radius=0.05)
-                    sphere = bpy.context.active_object
-                    sphere.name = f"Splat_{i}"
-                    
-                    # 노란색 머티리얼
-                    mat = bpy.data.materials.new(f"SplatMat_{i}")
-                    mat.use_nodes = True
-                    nodes = mat.node_tree.nodes
-                    nodes.clear()
-                    
-                    output = nodes.new('ShaderNodeOutputMaterial')
-                    emission = nodes.new('ShaderNodeEmission')
-                    emission.inputs['Color'].default_value = (*color, 1.0)
-                    emission.inputs['Strength'].default_value = 3.0
-                    
-                    mat.node_tree.links.new(emission.outputs['Emission'], output.inputs['Surface'])
-                    sphere.data.materials.append(mat)
-            
+            # 구체 연산자 대신 옥타히드론 템플릿을 타일링한 단일 메시
+            _tiled_point_mesh("Splat_Points", splat_sample + offset,
+                              splat_colors_sample, _OCTA_VERTS, _OCTA_FACES,
+                              strength=3.0)
+
             print(f"   ✅ 3DGS points created with offset: {offset}")
         
         # 7. 조명과 설정
@@ -188,14 +229,9 @@ def ultra_simple_main():
             bpy.context.scene.render.engine = 'CYCLES'
             print("   ✅ Using Cycles")
         
-        # 뷰포트 설정
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                for space in area.spaces:
-                    if space.type == 'VIEW_3D':
-                        space.shading.type = 'MATERIAL'
-                        break
-                break
+        # 뷰포트 설정 (spaces.active 기반 캐시 헬퍼, 중첩 스캔 제거)
+        from blender_colmap_3dgs.blender_animation import set_view3d
+        set_view3d(shading='MATERIAL')
         
         # 첫 프레임으로 이동
         bpy.context.scene.frame_set(1)
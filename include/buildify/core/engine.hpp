@@ -1,6 +1,7 @@
 #ifndef BUILDIFY_CORE_ENGINE_HPP
 #define BUILDIFY_CORE_ENGINE_HPP
 
+#include <cstdint>
 #include <memory>
 #include <string>
 #include <vector>
@@ -26,6 +27,9 @@ public:
     void shutdown();
 
     void update(double delta_time);
+    // Run `frames` updates in one call; callers driving many fixed-step
+    // frames avoid a binding crossing per frame.
+    void update_n(double delta_time, std::uint64_t frames);
     void render();
 
     std::shared_ptr<Scene> create_scene(const std::string& name);
@@ -35,10 +39,14 @@ public:
     void set_renderer(std::unique_ptr<Renderer> renderer);
     Renderer* get_renderer() const;
 
+    // every_n > 1 rate-limits the callback on the engine side; for Python
+    // callbacks the skipped frames never cross the language boundary or
+    // touch the GIL.
     template<typename T>
         requires std::invocable<T, double>
-    void add_update_callback(T&& callback) {
-        update_callbacks_.emplace_back(std::forward<T>(callback));
+    void add_update_callback(T&& callback, std::uint64_t every_n = 1) {
+        update_callbacks_.push_back({std::forward<T>(callback),
+                                     every_n > 0 ? every_n : 1});
     }
 
     bool is_running() const { return running_; }
@@ -48,8 +56,14 @@ private:
     struct Impl;
     std::unique_ptr<Impl> impl_;
     
+    struct UpdateCallback {
+        std::function<void(double)> callback;
+        std::uint64_t every_n = 1;
+    };
+
     bool running_ = false;
-    std::vector<std::function<void(double)>> update_callbacks_;
+    std::uint64_t update_count_ = 0;
+    std::vector<UpdateCallback> update_callbacks_;
 };
 
 }
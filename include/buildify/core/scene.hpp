@@ -7,8 +7,10 @@
 #include <optional>
 #include <concepts>
 #include <ranges>
+#include <unordered_map>
 
 #include "buildify/utils/math.hpp"
+#include "buildify/utils/pool_allocator.hpp"
 
 namespace buildify::core {
 
@@ -40,7 +42,12 @@ public:
         return entity;
     }
 
+    // Reserve capacity ahead of a known batch of add_entity calls so the
+    // entity vector and name index grow once instead of reallocating.
+    void reserve(std::size_t capacity);
+
     void add_entity(std::shared_ptr<Entity> entity);
+    void add_entities(const std::vector<std::shared_ptr<Entity>>& entities);
     void remove_entity(std::shared_ptr<Entity> entity);
     
     std::shared_ptr<Entity> find_entity(const std::string& name) const;
@@ -76,6 +83,11 @@ public:
 private:
     std::string name_;
     std::vector<std::shared_ptr<Entity>> entities_;
+    // Name index populated on add_entity; find_entity hits this first and
+    // only falls back to a scan for entities renamed after insertion.
+    // Mutable because find_entity self-heals entries invalidated by
+    // renames, mirroring the camera's lazily maintained matrix caches.
+    mutable std::unordered_map<std::string, std::shared_ptr<Entity>> entity_index_;
     std::shared_ptr<Camera> active_camera_;
     
     struct Impl;
@@ -87,12 +99,28 @@ public:
     explicit Entity(const std::string& name = "");
     virtual ~Entity() = default;
 
+    // Base Entity instances are pool-allocated like the math types;
+    // larger derived classes (Camera, ...) fall through to the heap.
+    static void* operator new(std::size_t size) {
+        if (size == sizeof(Entity)) {
+            return utils::PoolAllocator<Entity>::instance().allocate();
+        }
+        return ::operator new(size);
+    }
+    static void operator delete(void* ptr, std::size_t size) noexcept {
+        if (size == sizeof(Entity)) {
+            utils::PoolAllocator<Entity>::instance().deallocate(ptr);
+        } else {
+            ::operator delete(ptr);
+        }
+    }
+
     const std::string& get_name() const { return name_; }
     void set_name(const std::string& name) { name_ = name; }
 
     const utils::Transform& get_transform() const { return transform_; }
     utils::Transform& get_transform() { return transform_; }
-    void set_transform(const utils::Transform& transform) { transform_ = transform; }
+    virtual void set_transform(const utils::Transform& transform) { transform_ = transform; }
 
     virtual void update(double delta_time) {}
 
@@ -108,11 +136,28 @@ public:
     void set_perspective(float fov, float aspect_ratio, float near, float far);
     void set_orthographic(float left, float right, float bottom, float top, float near, float far);
 
-    utils::Matrix4<float> get_view_matrix() const;
-    utils::Matrix4<float> get_projection_matrix() const;
+    void set_transform(const utils::Transform& transform) override {
+        Entity::set_transform(transform);
+        view_dirty_ = true;
+    }
+
+    // Returned references point at the caches below and stay valid until
+    // the camera itself is destroyed, so bindings can expose them as
+    // zero-copy views.
+    const utils::Matrix4<float>& get_view_matrix() const;
+    const utils::Matrix4<float>& get_projection_matrix() const;
 
     void look_at(const utils::Vector3<float>& target, const utils::Vector3<float>& up = {0, 1, 0});
 
+    // Fused setup: set the perspective parameters, place the camera at
+    // eye and fill both matrix caches in one call, instead of separate
+    // set_perspective / set_transform / look_at calls that each dirty a
+    // cache only for the next getter to rebuild it.
+    void configure(float fov, float aspect_ratio, float near, float far,
+                   const utils::Vector3<float>& eye,
+                   const utils::Vector3<float>& target,
+                   const utils::Vector3<float>& up = {0, 1, 0});
+
 private:
     enum class ProjectionType { Perspective, Orthographic };
     ProjectionType projection_type_ = ProjectionType::Perspective;
@@ -126,6 +171,13 @@ private:
     float ortho_right_ = 1.0f;
     float ortho_bottom_ = -1.0f;
     float ortho_top_ = 1.0f;
+
+    // Lazily rebuilt matrix caches; the dirty flags are flipped by the
+    // set_* mutators above.
+    mutable utils::Matrix4<float> view_cache_;
+    mutable utils::Matrix4<float> proj_cache_;
+    mutable bool view_dirty_ = true;
+    mutable bool proj_dirty_ = true;
 };
 
 }
@@ -0,0 +1,90 @@
+#ifndef BUILDIFY_UTILS_BATCH_MATH_HPP
+#define BUILDIFY_UTILS_BATCH_MATH_HPP
+
+#include <cmath>
+#include <cstddef>
+
+#include "buildify/utils/math.hpp"
+
+namespace buildify::utils {
+
+// Batch kernels over contiguous float buffers. These exist so language
+// bindings can cross the boundary once per batch instead of once per
+// element; the loops are kept tight and branch-free so the compiler can
+// vectorize across lanes.
+
+template<Arithmetic T = float>
+void vec3_batch_ops(const T* a, const T* b, std::size_t count,
+                    T* sum, T* dot, T* cross, T* length) {
+    for (std::size_t i = 0; i < count; ++i) {
+        const T ax = a[i * 3], ay = a[i * 3 + 1], az = a[i * 3 + 2];
+        const T bx = b[i * 3], by = b[i * 3 + 1], bz = b[i * 3 + 2];
+
+        sum[i * 3]     = ax + bx;
+        sum[i * 3 + 1] = ay + by;
+        sum[i * 3 + 2] = az + bz;
+
+        dot[i] = ax * bx + ay * by + az * bz;
+
+        cross[i * 3]     = ay * bz - az * by;
+        cross[i * 3 + 1] = az * bx - ax * bz;
+        cross[i * 3 + 2] = ax * by - ay * bx;
+
+        length[i] = std::sqrt(ax * ax + ay * ay + az * az);
+    }
+}
+
+// Fused translate * rotate * scale for a batch of transforms. Writes one
+// row-major 4x4 matrix per element, matching Transform::to_matrix, without
+// materializing intermediate Matrix4 objects. UniformScale instantiates a
+// specialized kernel that reads one scale per element and reuses it for
+// all three axes — the dispatcher picks it when the batch qualifies.
+template<Arithmetic T = float, bool UniformScale = false>
+void transforms_to_matrices(const T* positions, const T* quats,
+                            const T* scales, std::size_t count, T* matrices) {
+    for (std::size_t i = 0; i < count; ++i) {
+        const T px = positions[i * 3], py = positions[i * 3 + 1], pz = positions[i * 3 + 2];
+        const T qx = quats[i * 4], qy = quats[i * 4 + 1], qz = quats[i * 4 + 2], qw = quats[i * 4 + 3];
+        const T sx = scales[i * 3];
+        const T sy = UniformScale ? sx : scales[i * 3 + 1];
+        const T sz = UniformScale ? sx : scales[i * 3 + 2];
+
+        const T xx = qx * qx, xy = qx * qy, xz = qx * qz, xw = qx * qw;
+        const T yy = qy * qy, yz = qy * qz, yw = qy * qw;
+        const T zz = qz * qz, zw = qz * qw;
+
+        T* m = matrices + i * 16;
+        m[0]  = (1 - 2 * (yy + zz)) * sx;
+        m[1]  = 2 * (xy - zw) * sy;
+        m[2]  = 2 * (xz + yw) * sz;
+        m[3]  = px;
+
+        m[4]  = 2 * (xy + zw) * sx;
+        m[5]  = (1 - 2 * (xx + zz)) * sy;
+        m[6]  = 2 * (yz - xw) * sz;
+        m[7]  = py;
+
+        m[8]  = 2 * (xz - yw) * sx;
+        m[9]  = 2 * (yz + xw) * sy;
+        m[10] = (1 - 2 * (xx + yy)) * sz;
+        m[11] = pz;
+
+        m[12] = 0;
+        m[13] = 0;
+        m[14] = 0;
+        m[15] = 1;
+    }
+}
+
+// Runtime-dispatched float32 entry points (src/utils/batch_math.cpp). The
+// compiler emits one clone per ISA level and installs the widest one the
+// host CPU supports at load time, so callers get native-width SIMD from a
+// portable binary.
+void vec3_batch_ops_dispatch(const float* a, const float* b, std::size_t count,
+                             float* sum, float* dot, float* cross, float* length);
+void transforms_to_matrices_dispatch(const float* positions, const float* quats,
+                                     const float* scales, std::size_t count, float* matrices);
+
+}
+
+#endif
@@ -7,6 +7,8 @@
 #include <algorithm>
 #include <concepts>
 
+#include "buildify/utils/pool_allocator.hpp"
+
 namespace buildify::utils {
 
 template<typename T>
@@ -19,6 +21,11 @@ struct Vector3 {
     constexpr Vector3() : x(0), y(0), z(0) {}
     constexpr Vector3(T x, T y, T z) : x(x), y(y), z(z) {}
 
+    // Heap instances (one per binding-side object) come from the per-type
+    // pool instead of the system allocator.
+    static void* operator new(std::size_t) { return PoolAllocator<Vector3>::instance().allocate(); }
+    static void operator delete(void* ptr) noexcept { PoolAllocator<Vector3>::instance().deallocate(ptr); }
+
     Vector3 operator+(const Vector3& other) const {
         return Vector3(x + other.x, y + other.y, z + other.z);
     }
@@ -169,6 +176,9 @@ struct Quaternion {
     constexpr Quaternion() : x(0), y(0), z(0), w(1) {}
     constexpr Quaternion(T x, T y, T z, T w) : x(x), y(y), z(z), w(w) {}
 
+    static void* operator new(std::size_t) { return PoolAllocator<Quaternion>::instance().allocate(); }
+    static void operator delete(void* ptr) noexcept { PoolAllocator<Quaternion>::instance().deallocate(ptr); }
+
     static Quaternion from_axis_angle(const Vector3<T>& axis, T angle) {
         T half_angle = angle * 0.5f;
         T s = std::sin(half_angle);
@@ -214,6 +224,9 @@ struct Transform {
     Quaternion<float> rotation;
     Vector3<float> scale{1, 1, 1};
 
+    static void* operator new(std::size_t) { return PoolAllocator<Transform>::instance().allocate(); }
+    static void operator delete(void* ptr) noexcept { PoolAllocator<Transform>::instance().deallocate(ptr); }
+
     Matrix4<float> to_matrix() const {
         return Matrix4<float>::translation(position) * 
                rotation.to_matrix() * 
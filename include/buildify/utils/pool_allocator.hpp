@@ -0,0 +1,62 @@
+#ifndef BUILDIFY_UTILS_POOL_ALLOCATOR_HPP
+#define BUILDIFY_UTILS_POOL_ALLOCATOR_HPP
+
+#include <cstddef>
+#include <memory>
+#include <vector>
+
+namespace buildify::utils {
+
+// Fixed-size free-list pool for small uniform objects that get created and
+// discarded in bulk, such as Vector3/Quaternion/Transform instances handed
+// across the binding boundary. allocate() pops the free-list head and
+// deallocate() pushes it back, both O(1); an exhausted pool grows by one
+// 64 KB block of pre-linked chunks.
+template<typename T>
+class PoolAllocator {
+public:
+    static PoolAllocator& instance() {
+        static PoolAllocator pool;
+        return pool;
+    }
+
+    void* allocate() {
+        if (!free_list_) {
+            grow();
+        }
+        Chunk* chunk = free_list_;
+        free_list_ = chunk->next;
+        return chunk;
+    }
+
+    void deallocate(void* ptr) noexcept {
+        auto* chunk = static_cast<Chunk*>(ptr);
+        chunk->next = free_list_;
+        free_list_ = chunk;
+    }
+
+private:
+    union Chunk {
+        Chunk* next;
+        alignas(T) std::byte storage[sizeof(T)];
+    };
+
+    static constexpr std::size_t block_bytes = 64 * 1024;
+    static constexpr std::size_t chunks_per_block = block_bytes / sizeof(Chunk);
+
+    void grow() {
+        auto block = std::make_unique<Chunk[]>(chunks_per_block);
+        for (std::size_t i = chunks_per_block; i > 0; --i) {
+            block[i - 1].next = free_list_;
+            free_list_ = &block[i - 1];
+        }
+        blocks_.push_back(std::move(block));
+    }
+
+    Chunk* free_list_ = nullptr;
+    std::vector<std::unique_ptr<Chunk[]>> blocks_;
+};
+
+}
+
+#endif
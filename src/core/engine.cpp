@@ -67,8 +67,17 @@ void Engine::update(double delta_time) {
         impl_->active_scene->update(delta_time);
     }
 
-    for (const auto& callback : update_callbacks_) {
-        callback(delta_time);
+    ++update_count_;
+    for (const auto& entry : update_callbacks_) {
+        if (entry.every_n == 1 || update_count_ % entry.every_n == 0) {
+            entry.callback(delta_time);
+        }
+    }
+}
+
+void Engine::update_n(double delta_time, std::uint64_t frames) {
+    for (std::uint64_t i = 0; i < frames; ++i) {
+        update(delta_time);
     }
 }
 
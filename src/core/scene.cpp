@@ -2,6 +2,7 @@
 #include "buildify/utils/logger.hpp"
 
 #include <algorithm>
+#include <execution>
 #include <fstream>
 
 namespace buildify::core {
@@ -18,23 +19,61 @@ Scene::~Scene() = default;
 Scene::Scene(Scene&&) noexcept = default;
 Scene& Scene::operator=(Scene&&) noexcept = default;
 
+void Scene::reserve(std::size_t capacity) {
+    entities_.reserve(capacity);
+    entity_index_.reserve(capacity);
+}
+
 void Scene::add_entity(std::shared_ptr<Entity> entity) {
     entities_.push_back(entity);
+    entity_index_[entity->get_name()] = entity;
     utils::log_debug("Entity '{}' added to scene '{}'", entity->get_name(), name_);
 }
 
+void Scene::add_entities(const std::vector<std::shared_ptr<Entity>>& entities) {
+    entities_.reserve(entities_.size() + entities.size());
+    entity_index_.reserve(entity_index_.size() + entities.size());
+    for (const auto& entity : entities) {
+        entities_.push_back(entity);
+        entity_index_[entity->get_name()] = entity;
+    }
+    utils::log_debug("{} entities added to scene '{}'", entities.size(), name_);
+}
+
 void Scene::remove_entity(std::shared_ptr<Entity> entity) {
     auto it = std::find(entities_.begin(), entities_.end(), entity);
     if (it != entities_.end()) {
         entities_.erase(it);
+        auto indexed = entity_index_.find(entity->get_name());
+        if (indexed != entity_index_.end() && indexed->second == entity) {
+            entity_index_.erase(indexed);
+        } else {
+            // The entity was renamed after insertion, so its index entry
+            // sits under the old name; purge by value so the stale
+            // mapping cannot outlive the entity's scene membership.
+            std::erase_if(entity_index_, [&entity](const auto& entry) {
+                return entry.second == entity;
+            });
+        }
         utils::log_debug("Entity '{}' removed from scene '{}'", entity->get_name(), name_);
     }
 }
 
 std::shared_ptr<Entity> Scene::find_entity(const std::string& name) const {
+    auto indexed = entity_index_.find(name);
+    if (indexed != entity_index_.end()) {
+        if (indexed->second->get_name() == name) {
+            return indexed->second;
+        }
+        // The entry went stale when the entity was renamed; drop it and
+        // fall through to the scan rather than returning the wrong hit.
+        entity_index_.erase(indexed);
+    }
+
+    // Entities renamed after insertion are not in the index; scan for them.
     auto it = std::find_if(entities_.begin(), entities_.end(),
         [&name](const auto& entity) { return entity->get_name() == name; });
-    
+
     return (it != entities_.end()) ? *it : nullptr;
 }
 
@@ -47,9 +86,10 @@ std::shared_ptr<Camera> Scene::get_active_camera() const {
 }
 
 void Scene::update(double delta_time) {
-    for (auto& entity : entities_) {
-        entity->update(delta_time);
-    }
+    // Entity updates are independent of each other; let the runtime spread
+    // them across threads and SIMD lanes.
+    std::for_each(std::execution::par_unseq, entities_.begin(), entities_.end(),
+        [delta_time](auto& entity) { entity->update(delta_time); });
 }
 
 void Scene::load_from_file(const std::string& path) {
@@ -80,6 +120,7 @@ void Camera::set_perspective(float fov, float aspect_ratio, float near, float fa
     aspect_ratio_ = aspect_ratio;
     near_ = near;
     far_ = far;
+    proj_dirty_ = true;
 }
 
 void Camera::set_orthographic(float left, float right, float bottom, float top, float near, float far) {
@@ -90,9 +131,14 @@ void Camera::set_orthographic(float left, float right, float bottom, float top,
     ortho_top_ = top;
     near_ = near;
     far_ = far;
+    proj_dirty_ = true;
 }
 
-utils::Matrix4<float> Camera::get_view_matrix() const {
+const utils::Matrix4<float>& Camera::get_view_matrix() const {
+    if (!view_dirty_) {
+        return view_cache_;
+    }
+
     auto& t = transform_;
     auto pos = t.position;
     auto forward = t.rotation.to_matrix() * utils::Vector4<float>(0, 0, -1, 0);
@@ -109,12 +155,18 @@ utils::Matrix4<float> Camera::get_view_matrix() const {
     view.m[2][0] = -f.x; view.m[2][1] = -f.y; view.m[2][2] = -f.z; view.m[2][3] = f.dot(pos);
     view.m[3][0] = 0; view.m[3][1] = 0; view.m[3][2] = 0; view.m[3][3] = 1;
 
-    return view;
+    view_cache_ = view;
+    view_dirty_ = false;
+    return view_cache_;
 }
 
-utils::Matrix4<float> Camera::get_projection_matrix() const {
+const utils::Matrix4<float>& Camera::get_projection_matrix() const {
+    if (!proj_dirty_) {
+        return proj_cache_;
+    }
+
     if (projection_type_ == ProjectionType::Perspective) {
-        return utils::Matrix4<float>::perspective(fov_, aspect_ratio_, near_, far_);
+        proj_cache_ = utils::Matrix4<float>::perspective(fov_, aspect_ratio_, near_, far_);
     } else {
         utils::Matrix4<float> ortho;
         ortho.m[0][0] = 2.0f / (ortho_right_ - ortho_left_);
@@ -123,8 +175,11 @@ utils::Matrix4<float> Camera::get_projection_matrix() const {
         ortho.m[0][3] = -(ortho_right_ + ortho_left_) / (ortho_right_ - ortho_left_);
         ortho.m[1][3] = -(ortho_top_ + ortho_bottom_) / (ortho_top_ - ortho_bottom_);
         ortho.m[2][3] = -(far_ + near_) / (far_ - near_);
-        return ortho;
+        proj_cache_ = ortho;
     }
+
+    proj_dirty_ = false;
+    return proj_cache_;
 }
 
 void Camera::look_at(const utils::Vector3<float>& target, const utils::Vector3<float>& up) {
@@ -144,4 +199,30 @@ void Camera::look_at(const utils::Vector3<float>& target, const utils::Vector3<f
     rotation_matrix.m[2][2] = -forward.z;
 }
 
+void Camera::configure(float fov, float aspect_ratio, float near, float far,
+                       const utils::Vector3<float>& eye,
+                       const utils::Vector3<float>& target,
+                       const utils::Vector3<float>& up) {
+    set_perspective(fov, aspect_ratio, near, far);
+    transform_.position = eye;
+
+    utils::Vector3<float> f = (target - eye).normalized();
+    utils::Vector3<float> r = f.cross(up).normalized();
+    utils::Vector3<float> u = r.cross(f);
+
+    // Write both caches directly; the fused path leaves nothing dirty,
+    // so the next get_view_matrix/get_projection_matrix are free.
+    utils::Matrix4<float> view;
+    view.m[0][0] = r.x; view.m[0][1] = r.y; view.m[0][2] = r.z; view.m[0][3] = -r.dot(eye);
+    view.m[1][0] = u.x; view.m[1][1] = u.y; view.m[1][2] = u.z; view.m[1][3] = -u.dot(eye);
+    view.m[2][0] = -f.x; view.m[2][1] = -f.y; view.m[2][2] = -f.z; view.m[2][3] = f.dot(eye);
+    view.m[3][0] = 0; view.m[3][1] = 0; view.m[3][2] = 0; view.m[3][3] = 1;
+
+    view_cache_ = view;
+    view_dirty_ = false;
+
+    proj_cache_ = utils::Matrix4<float>::perspective(fov, aspect_ratio, near, far);
+    proj_dirty_ = false;
+}
+
 }
\ No newline at end of file
@@ -0,0 +1,62 @@
+#include "buildify/utils/batch_math.hpp"
+
+namespace buildify::utils {
+
+// target_clones compiles each kernel once per ISA level and resolves the
+// widest supported clone via cpuid when the library is loaded. flatten
+// forces the generic template loops to be inlined into every clone so each
+// one is actually vectorized at its own ISA width. Shipping -march=native
+// objects would SIGILL on older CPUs; this keeps one portable binary.
+#if defined(__GNUC__) && defined(__x86_64__)
+#define BUILDIFY_SIMD_CLONES \
+    __attribute__((flatten, target_clones("default", "sse4.2", "avx2", "avx512f")))
+#else
+#define BUILDIFY_SIMD_CLONES
+#endif
+
+BUILDIFY_SIMD_CLONES
+void vec3_batch_ops_dispatch(const float* a, const float* b, std::size_t count,
+                             float* sum, float* dot, float* cross, float* length) {
+    vec3_batch_ops<float>(a, b, count, sum, dot, cross, length);
+}
+
+namespace {
+
+bool scales_are_uniform(const float* scales, std::size_t count) {
+    for (std::size_t i = 0; i < count; ++i) {
+        if (scales[i * 3] != scales[i * 3 + 1] || scales[i * 3] != scales[i * 3 + 2]) {
+            return false;
+        }
+    }
+    return true;
+}
+
+BUILDIFY_SIMD_CLONES
+void transforms_to_matrices_generic(const float* positions, const float* quats,
+                                    const float* scales, std::size_t count, float* matrices) {
+    transforms_to_matrices<float, false>(positions, quats, scales, count, matrices);
+}
+
+BUILDIFY_SIMD_CLONES
+void transforms_to_matrices_uniform(const float* positions, const float* quats,
+                                    const float* scales, std::size_t count, float* matrices) {
+    transforms_to_matrices<float, true>(positions, quats, scales, count, matrices);
+}
+
+}
+
+// Partial evaluation without a JIT: both specializations are compiled
+// ahead of time from the same template and the cheap O(N) scan picks the
+// one whose baked assumptions hold for this batch. Uniform scales (the
+// common case for splat batches) drop two loads and let the compiler keep
+// one splat register per lane.
+void transforms_to_matrices_dispatch(const float* positions, const float* quats,
+                                     const float* scales, std::size_t count, float* matrices) {
+    if (scales_are_uniform(scales, count)) {
+        transforms_to_matrices_uniform(positions, quats, scales, count, matrices);
+    } else {
+        transforms_to_matrices_generic(positions, quats, scales, count, matrices);
+    }
+}
+
+}